@@ -17,6 +17,30 @@ DEFAULT_DISK_GB: int = 20
 DEFAULT_OS_VARIANT: str = "generic"
 DEFAULT_NETWORK: str = "default"
 
+# Device choices offered by the create and edit screens: (value, label)
+NIC_MODEL_OPTIONS: list[tuple[str, str]] = [
+    ("virtio", "VirtIO (Best performance)"),
+    ("e1000e", "Intel e1000e (Good compatibility)"),
+    ("e1000", "Intel e1000 (Legacy)"),
+    ("rtl8139", "Realtek RTL8139 (Wide compatibility)"),
+    ("vmxnet3", "VMware vmxnet3"),
+]
+GRAPHICS_OPTIONS: list[tuple[str, str]] = [
+    ("spice", "SPICE - Remote desktop (recommended)"),
+    ("vnc", "VNC - Basic remote viewer"),
+    ("none", "None - Serial console only"),
+]
+AUDIO_OPTIONS: list[tuple[str, str]] = [
+    ("ich9", "Intel ICH9 (Recommended)"),
+    ("ich6", "Intel ICH6"),
+    ("ac97", "AC97 (Legacy)"),
+    ("none", "None"),
+]
+AUTOSTART_OPTIONS: list[tuple[str, str]] = [
+    ("yes", "Yes - Start on host boot"),
+    ("no", "No"),
+]
+
 # UI settings
 REFRESH_INTERVAL_MS: int = 2000
 LIST_PAGE_SIZE: int = 20
@@ -141,49 +141,102 @@ class GPUService:
                 )
 
                 if result.returncode == 0 and result.stdout:
-                    line = result.stdout.strip()
-                    # Parse the line
-                    parts = line.split(" ", 1)
-                    if len(parts) >= 2:
-                        desc = parts[1]
-
-                        # Extract vendor:device IDs
-                        id_match = re.search(r"\[([0-9a-f]{4}):([0-9a-f]{4})\]", desc)
-                        vendor_id = id_match.group(1) if id_match else "0000"
-                        device_id = id_match.group(2) if id_match else "0000"
-
-                        # Determine device type
-                        if "VGA" in desc or "3D" in desc or "Display" in desc:
-                            device_type = "VGA"
-                        elif "Audio" in desc:
-                            device_type = "Audio"
-                        elif "USB" in desc:
-                            device_type = "USB"
-                        elif "Serial" in desc or "Communication" in desc:
-                            device_type = "Serial"
-                        else:
-                            device_type = "Other"
-
-                        # Parse name
-                        name_match = re.search(r":\s+(.+?)\s+\[", desc)
-                        full_name = name_match.group(1) if name_match else desc
-                        vendor_name, device_name = self._parse_device_name(full_name)
-
-                        devices.append(GPUDevice(
-                            pci_address=dev_addr,
-                            vendor_id=vendor_id,
-                            device_id=device_id,
-                            vendor_name=vendor_name,
-                            device_name=device_name,
-                            iommu_group=group_id,
-                            device_type=device_type,
-                        ))
+                    device = self._parse_group_device(result.stdout.strip(), group_id)
+                    if device:
+                        devices.append(device)
 
         except OSError:
             pass
 
         return IOMMUGroup(group_id=group_id, devices=devices)
 
+    def _parse_group_device(self, line: str, group_id: int) -> GPUDevice | None:
+        """Parse one `lspci -nn` line into an IOMMU group member."""
+        parts = line.split(" ", 1)
+        if len(parts) < 2:
+            return None
+        dev_addr, desc = parts
+
+        # Extract vendor:device IDs
+        id_match = re.search(r"\[([0-9a-f]{4}):([0-9a-f]{4})\]", desc)
+        vendor_id = id_match.group(1) if id_match else "0000"
+        device_id = id_match.group(2) if id_match else "0000"
+
+        # Determine device type
+        if "VGA" in desc or "3D" in desc or "Display" in desc:
+            device_type = "VGA"
+        elif "Audio" in desc:
+            device_type = "Audio"
+        elif "USB" in desc:
+            device_type = "USB"
+        elif "Serial" in desc or "Communication" in desc:
+            device_type = "Serial"
+        else:
+            device_type = "Other"
+
+        # Parse name
+        name_match = re.search(r":\s+(.+?)\s+\[", desc)
+        full_name = name_match.group(1) if name_match else desc
+        vendor_name, device_name = self._parse_device_name(full_name)
+
+        return GPUDevice(
+            pci_address=dev_addr,
+            vendor_id=vendor_id,
+            device_id=device_id,
+            vendor_name=vendor_name,
+            device_name=device_name,
+            iommu_group=group_id,
+            device_type=device_type,
+        )
+
+    def get_all_iommu_groups(self) -> dict[str, IOMMUGroup]:
+        """Get the IOMMU group of every PCI device in one sysfs sweep.
+
+        Uses a single `lspci -nn` call for device details instead of one
+        per device. Returns a dict mapping PCI address to its group.
+        """
+        groups_path = Path("/sys/kernel/iommu_groups")
+        members: dict[int, list[str]] = {}
+        try:
+            for group_dir in groups_path.iterdir():
+                try:
+                    group_id = int(group_dir.name)
+                    members[group_id] = sorted(
+                        link.name.replace("0000:", "") for link in (group_dir / "devices").iterdir()
+                    )
+                except (ValueError, OSError):
+                    continue
+        except OSError:
+            return {}
+
+        if not members:
+            return {}
+
+        lines: dict[str, str] = {}
+        try:
+            result = subprocess.run(
+                ["lspci", "-nn"],
+                capture_output=True,
+                text=True,
+            )
+            for line in result.stdout.splitlines():
+                addr = line.split(" ", 1)[0]
+                lines[addr] = line
+        except FileNotFoundError:
+            pass
+
+        by_address: dict[str, IOMMUGroup] = {}
+        for group_id, addresses in members.items():
+            group = IOMMUGroup(group_id=group_id)
+            for addr in addresses:
+                device = self._parse_group_device(lines.get(addr, ""), group_id)
+                if device:
+                    group.devices.append(device)
+            for addr in addresses:
+                by_address[addr] = group
+
+        return by_address
+
     def check_iommu_enabled(self) -> bool:
         """Check if IOMMU is enabled."""
         # Check for IOMMU groups
@@ -1,5 +1,6 @@
 """Network detection service."""
 
+import json
 import subprocess
 from pathlib import Path
 
@@ -58,3 +59,39 @@ class NetworkService:
             pass
 
         return info
+
+    def get_all_bridge_info(self, bridges: list[str] | None = None) -> dict[str, dict[str, str]]:
+        """Get info for all bridges from a single `ip` call.
+
+        Returns a dict keyed by bridge name (in bridge list order) with the same
+        keys as get_bridge_info().
+        """
+        if bridges is None:
+            bridges = self.list_bridges()
+        infos: dict[str, dict[str, str]] = {bridge: {} for bridge in bridges}
+        if not bridges:
+            return infos
+
+        try:
+            result = subprocess.run(
+                ["ip", "-json", "addr", "show"],
+                capture_output=True,
+                text=True,
+            )
+            if result.returncode != 0 or not result.stdout:
+                return infos
+            interfaces = json.loads(result.stdout)
+        except (FileNotFoundError, ValueError):
+            return infos
+
+        for iface in interfaces:
+            info = infos.get(iface.get("ifname", ""))
+            if info is None:
+                continue
+            if "operstate" in iface:
+                info["state"] = iface["operstate"]
+            addrs = iface.get("addr_info") or []
+            if addrs and "local" in addrs[0]:
+                info["ip"] = f"{addrs[0]['local']}/{addrs[0].get('prefixlen', '')}".rstrip("/")
+
+        return infos
@@ -1,10 +1,14 @@
 """Main application class."""
 
+import queue
 import signal
 import subprocess
 import sys
+import termios
 import threading
+import time
 from collections.abc import Callable
+from concurrent.futures import Future, wait
 from typing import Any
 
 from blessed import Terminal
@@ -16,54 +20,83 @@ from vm_manager.ui.screens.create import CreateWizard
 from vm_manager.ui.screens.main import MainScreen
 from vm_manager.ui.theme import Theme
 from vm_manager.ui.widgets.checkpoint_dialog import CheckpointDialog
-from vm_manager.ui.widgets.dialog import ConfirmDialog, DeleteDialog, InputDialog, MessageDialog, SelectDialog
-
-
-class BackgroundTask:
-    """A task that runs in the background."""
+from vm_manager.ui.widgets.dialog import (
+    ConfirmDialog,
+    DeleteDialog,
+    InputDialog,
+    MessageDialog,
+    ProgressDialog,
+    SelectDialog,
+)
+
+
+class WorkerPool:
+    """Fixed set of daemon worker threads that hand results back as Futures.
+
+    ThreadPoolExecutor workers are joined at interpreter exit, so a libvirt
+    call stuck on a slow libvirtd would keep the app from quitting.
+    """
+
+    def __init__(self, max_workers: int, name: str) -> None:
+        self._queue: queue.SimpleQueue[tuple[Future[Any], Callable[[], Any]] | None] = (
+            queue.SimpleQueue()
+        )
+        self._futures: set[Future[Any]] = set()  # Submitted and not yet finished
+        self._lock = threading.Lock()
+        self._workers = max_workers
+        for i in range(max_workers):
+            threading.Thread(target=self._work, name=f"{name}-{i}", daemon=True).start()
+
+    def submit(self, func: Callable[[], Any]) -> Future[Any]:
+        """Queue func for a worker thread."""
+        future: Future[Any] = Future()
+        with self._lock:
+            self._futures.add(future)
+        future.add_done_callback(self._forget)
+        self._queue.put((future, func))
+        return future
+
+    def _forget(self, future: Future[Any]) -> None:
+        """Drop a finished future from the in-flight set."""
+        with self._lock:
+            self._futures.discard(future)
+
+    def _work(self) -> None:
+        """Worker thread: run queued calls until shut down."""
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+            future, func = item
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                result = func()
+            except BaseException as e:
+                future.set_exception(e)
+            else:
+                future.set_result(result)
 
-    def __init__(
-        self,
-        func: Callable[[], Any],
-        on_success: Callable[[Any], None] | None = None,
-        on_error: Callable[[Exception], None] | None = None,
-    ):
-        self.func = func
-        self.on_success = on_success
-        self.on_error = on_error
-        self.result: Any = None
-        self.error: Exception | None = None
-        self.done = False
-        self.thread: threading.Thread | None = None
-
-    def start(self) -> None:
-        """Start the task in a background thread."""
-        self.thread = threading.Thread(target=self._run, daemon=True)
-        self.thread.start()
-
-    def _run(self) -> None:
-        """Run the task."""
-        try:
-            self.result = self.func()
-        except Exception as e:
-            self.error = e
-        finally:
-            self.done = True
+    def shutdown(self, timeout: float) -> bool:
+        """Cancel queued calls and wait up to timeout for running ones.
 
-    def check(self) -> bool:
-        """Check if task is done and call callbacks. Returns True if done."""
-        if self.done:
-            if self.error and self.on_error:
-                self.on_error(self.error)
-            elif self.on_success:
-                self.on_success(self.result)
-            return True
-        return False
+        Returns True if nothing is still running.
+        """
+        with self._lock:
+            pending = list(self._futures)
+        for future in pending:
+            future.cancel()  # Only succeeds for calls that haven't started
+        for _ in range(self._workers):
+            self._queue.put(None)
+        _, not_done = wait(pending, timeout=timeout)
+        return not not_done
 
 
 class App:
     """Main VM Manager application."""
 
+    SHUTDOWN_TIMEOUT = 2.0  # Seconds to let running libvirt calls finish on quit
+
     def __init__(self) -> None:
         self.term = Terminal()
         self.theme = Theme(self.term)
@@ -72,7 +105,32 @@ class App:
         self.osinfo_service = OSInfoService()
         self.main_screen: MainScreen | None = None
         self.running = False
-        self.background_tasks: list[BackgroundTask] = []
+        # In-flight background actions: (future, on_success, on_error)
+        self.background_tasks: list[
+            tuple[Future[Any], Callable[[Any], None], Callable[[Exception], None]]
+        ] = []
+        # Shared worker pool for VM actions (avoids spawning a thread per task)
+        self._executor = WorkerPool(max_workers=4, name="vmtui")
+        # Background VM listing (see _refresh_async); at most one in flight
+        self._refresh_future: Future[Any] | None = None
+        self._refresh_generation = 0  # MainScreen.vms_generation when it was submitted
+        self._refresh_again = False  # Requested while one was in flight
+        self._refresh_announce = False  # Report "Refreshed" when the listing lands
+        # Set by SIGWINCH so the main loop only queries terminal size after a resize
+        self._size_dirty = True
+        # Action name (from MainScreen.handle_key) -> handler
+        self._actions: dict[str, Callable[[], None]] = {
+            "quit": self._quit,
+            "refresh": self._refresh,
+            "new": self._create_vm,
+            "delete": self._delete_vm,
+            "start": self._start_vm,
+            "stop": self._stop_vm,
+            "save_edit": self._save_inline_edit,
+            "console": self._open_console,
+            "snapshots": self._manage_snapshots,
+            "help": self._show_help,
+        }
 
     def run(self) -> int:
         """Run the application. Returns exit code."""
@@ -80,8 +138,12 @@ class App:
         def handle_signal(signum: int, frame: Any) -> None:
             self.running = False
 
+        def handle_resize(signum: int, frame: Any) -> None:
+            self._size_dirty = True
+
         signal.signal(signal.SIGINT, handle_signal)
         signal.signal(signal.SIGTERM, handle_signal)
+        signal.signal(signal.SIGWINCH, handle_resize)
 
         try:
             # Check for libosinfo and show hint if not available
@@ -119,7 +181,10 @@ class App:
             return 1
         finally:
             self.running = False
-            self.libvirt.disconnect()
+            # Workers may still be using the connection; if one is stuck, leave it
+            # to be torn down with the process instead of closing it under them
+            if self._executor.shutdown(timeout=self.SHUTDOWN_TIMEOUT):
+                self.libvirt.disconnect()
 
     def _ensure_directories(self) -> None:
         """Ensure required directories exist."""
@@ -132,25 +197,34 @@ class App:
 
         with self.term.fullscreen(), self.term.cbreak(), self.term.hidden_cursor():
             needs_redraw = True
+            force_redraw = True  # Screen may have been drawn over (dialogs, resize)
             last_width = self.term.width
             last_height = self.term.height
 
             while self.running:
-                # Check for terminal resize
-                if self.term.width != last_width or self.term.height != last_height:
-                    last_width = self.term.width
-                    last_height = self.term.height
-                    needs_redraw = True
+                # Check for terminal resize (only after SIGWINCH)
+                if self._size_dirty:
+                    self._size_dirty = False
+                    width, height = self.term.width, self.term.height
+                    if width != last_width or height != last_height:
+                        last_width = width
+                        last_height = height
+                        needs_redraw = True
+                        force_redraw = True
 
                 # Check background tasks
                 tasks_completed = self._check_background_tasks()
                 if tasks_completed:
                     needs_redraw = True
+                if self._check_refresh():
+                    needs_redraw = True
 
-                # Render main screen only when needed
-                if needs_redraw:
-                    self.main_screen.render()
+                # Render main screen only when needed (status updates from
+                # callbacks mark the screen dirty themselves)
+                if needs_redraw or self.main_screen.dirty:
+                    self.main_screen.render(force=force_redraw)
                     needs_redraw = False
+                    force_redraw = False
 
                 # Wait for input with shorter timeout to check tasks more often
                 key: Keystroke = self.term.inkey(timeout=0.5)
@@ -161,24 +235,84 @@ class App:
                     )
                     self._handle_action(action)
                     needs_redraw = True
+                    # Actions may open dialogs or other screens; plain keys only
+                    # change what MainScreen draws, which it repaints by diffing
+                    force_redraw = action is not None
 
         return 0
 
     def _check_background_tasks(self) -> bool:
         """Check and process completed background tasks. Returns True if any completed."""
-        completed = []
-        for task in self.background_tasks:
-            if task.check():
-                completed.append(task)
+        if not self.background_tasks:
+            return False
 
-        for task in completed:
-            self.background_tasks.remove(task)
+        pending = []
+        completed = False
+        for future, on_success, on_error in self.background_tasks:
+            if not future.done():
+                pending.append((future, on_success, on_error))
+                continue
+
+            completed = True
+            error = future.exception()
+            if error is None:
+                on_success(future.result())
+            elif isinstance(error, Exception):
+                on_error(error)
+
+        self.background_tasks = pending
 
         # Refresh VMs if any tasks completed
-        if completed and self.main_screen:
-            self.main_screen.refresh_vms()
+        if completed:
+            self._refresh_async()
+
+        return completed
 
-        return len(completed) > 0
+    def _refresh_async(self, announce: bool = False) -> None:
+        """List VMs on the worker pool so a slow libvirtd doesn't stall input."""
+        assert self.main_screen is not None
+
+        self._refresh_announce = self._refresh_announce or announce
+        if self._refresh_future is not None:
+            # The pending listing may predate whatever prompted this request
+            self._refresh_again = True
+            return
+        self._refresh_generation = self.main_screen.vms_generation
+        self._refresh_future = self._executor.submit(self.libvirt.list_vms)
+
+    def _check_refresh(self) -> bool:
+        """Apply a finished background VM listing. Returns True if one was applied."""
+        future = self._refresh_future
+        if future is None or not future.done() or self.main_screen is None:
+            return False
+        self._refresh_future = None
+
+        if self._refresh_again:
+            self._refresh_again = False
+            self._refresh_async()
+            return False
+
+        # A synchronous refresh_vms() since submitting already shows newer data
+        if self.main_screen.vms_generation == self._refresh_generation:
+            error = future.exception()
+            if error is None:
+                self.main_screen.set_vms(future.result())
+            elif isinstance(error, Exception):
+                self.main_screen.set_vms_error(error)
+        if self._refresh_announce:
+            self.main_screen.set_status("Refreshed", "success")
+        self._refresh_announce = False
+        return True
+
+    def _submit(
+        self,
+        func: Callable[[], Any],
+        on_success: Callable[[Any], None],
+        on_error: Callable[[Exception], None],
+    ) -> None:
+        """Run func on the worker pool. Callbacks run on the UI thread once it finishes."""
+        future = self._executor.submit(func)
+        self.background_tasks.append((future, on_success, on_error))
 
     def _handle_action(self, action: str | None) -> None:
         """Handle action from main screen."""
@@ -187,27 +321,20 @@ class App:
         if action is None:
             return
 
-        if action == "quit":
-            self.running = False
-        elif action == "refresh":
-            self.main_screen.refresh_vms()
-            self.main_screen.set_status("Refreshed", "success")
-        elif action == "new":
-            self._create_vm()
-        elif action == "delete":
-            self._delete_vm()
-        elif action == "start":
-            self._start_vm()
-        elif action == "stop":
-            self._stop_vm()
-        elif action == "save_edit":
-            self._save_inline_edit()
-        elif action == "console":
-            self._open_console()
-        elif action == "snapshots":
-            self._manage_snapshots()
-        elif action == "help":
-            self._show_help()
+        handler = self._actions.get(action)
+        if handler:
+            handler()
+
+    def _quit(self) -> None:
+        """Stop the main loop."""
+        self.running = False
+
+    def _refresh(self) -> None:
+        """Reload the VM list."""
+        assert self.main_screen is not None
+
+        self.main_screen.set_status("Refreshing...", "info")
+        self._refresh_async(announce=True)
 
     def _create_vm(self) -> None:
         """Show VM creation wizard."""
@@ -256,7 +383,7 @@ class App:
             return
 
         # Check if storage exists
-        has_storage = len(vm.disks) > 0 and any(d.exists() for d in vm.disks)
+        has_storage = any(disk.exists() for disk in vm.disks)
 
         # Show delete dialog with type-back confirmation
         dialog = DeleteDialog(
@@ -271,10 +398,6 @@ class App:
             delete_config, delete_storage = result
 
             # Show progress dialog for deletion
-            import threading
-            import time
-            from vm_manager.ui.widgets.dialog import ProgressDialog
-
             # Determine what we're deleting for the progress message
             if delete_config and delete_storage:
                 progress_msg = f"Deleting VM '{vm.name}' and storage..."
@@ -313,14 +436,11 @@ class App:
             with self.term.hidden_cursor():
                 while thread.is_alive():
                     progress.show_frame()
-                    # Drain input buffer to prevent key buffering
-                    while True:
-                        key = self.term.inkey(timeout=0)
-                        if not key:
-                            break
+                    self._discard_input()
                     time.sleep(0.1)
 
             thread.join()
+            self._discard_input()
 
             if error[0]:
                 self.main_screen.set_status(f"Failed to delete: {error[0]}", "error")
@@ -329,6 +449,17 @@ class App:
 
             self.main_screen.refresh_vms()
 
+    def _discard_input(self) -> None:
+        """Drop keys typed while a blocking operation runs."""
+        # tcflush empties the kernel queue in one call, but blessed may already
+        # have read keys into its own buffer, so drain that as well
+        try:
+            termios.tcflush(sys.stdin, termios.TCIFLUSH)
+        except (termios.error, OSError):
+            pass
+        while self.term.inkey(timeout=0):
+            pass
+
     def _start_vm(self) -> None:
         """Start the selected VM."""
         assert self.main_screen is not None
@@ -371,9 +502,7 @@ class App:
             if self.main_screen:
                 self.main_screen.set_status(f"Failed to start: {e}", "error")
 
-        task = BackgroundTask(do_start, on_success, on_error)
-        task.start()
-        self.background_tasks.append(task)
+        self._submit(do_start, on_success, on_error)
 
     def _stop_vm(self) -> None:
         """Stop the selected VM."""
@@ -423,9 +552,7 @@ class App:
                 if self.main_screen:
                     self.main_screen.set_status(f"Failed to reset: {e}", "error")
 
-            task = BackgroundTask(do_reset, on_reset_success, on_reset_error)
-            task.start()
-            self.background_tasks.append(task)
+            self._submit(do_reset, on_reset_success, on_reset_error)
             return
 
         # Handle stop
@@ -453,9 +580,7 @@ class App:
             if self.main_screen:
                 self.main_screen.set_status(f"Failed to stop: {e}", "error")
 
-        task = BackgroundTask(do_stop, on_success, on_error)
-        task.start()
-        self.background_tasks.append(task)
+        self._submit(do_stop, on_success, on_error)
 
     def _save_inline_edit(self) -> None:
         """Save changes from inline edit mode."""
@@ -478,10 +603,12 @@ class App:
             # First, steal devices from other VMs if needed
             if "_devices_to_steal" in changes:
                 devices_to_steal = changes.pop("_devices_to_steal")
+                # Look up every VM once rather than once per stolen device
+                vms_by_name = {v.name: v for v in self.libvirt.list_vms()}
                 for device_id, (from_vm, device_type) in devices_to_steal.items():
                     try:
                         # Get the other VM
-                        other_vm = next((v for v in self.libvirt.list_vms() if v.name == from_vm), None)
+                        other_vm = vms_by_name.get(from_vm)
                         if other_vm:
                             if device_type == "gpu":
                                 # Remove GPU from other VM
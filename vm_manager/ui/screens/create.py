@@ -1,17 +1,26 @@
 """VM creation wizard screen."""
 
+import os
+import signal
+import sys
+import time
+from collections.abc import Callable
 from pathlib import Path
+from typing import Any, TypeVar, cast
 
 from blessed import Terminal
 from blessed.keyboard import Keystroke
 
 from vm_manager.config import (
+    AUDIO_OPTIONS,
     DEFAULT_DISK_GB,
     DEFAULT_NETWORK,
     DEFAULT_OS_VARIANT,
     DEFAULT_RAM_MB,
     DEFAULT_VCPUS,
+    GRAPHICS_OPTIONS,
     ISO_DIR,
+    NIC_MODEL_OPTIONS,
 )
 from vm_manager.models import GPUDevice, USBDevice, VMConfig
 from vm_manager.services import GPUService, LibvirtService, NetworkService, OSInfoService, SystemService, USBService
@@ -20,10 +29,45 @@ from vm_manager.ui.theme import Theme
 from vm_manager.ui.widgets.form import FieldType, Form, FormField
 from vm_manager.ui.widgets.search_select import SearchSelect
 
+T = TypeVar("T")
+
+
+def _parse_int(value: str | None, default: int) -> int:
+    """Parse a numeric form value, falling back to default when blank or invalid."""
+    return int(value) if value and value.isdigit() else default
+
 
 class CreateWizard:
     """Step-by-step VM creation wizard."""
 
+    OPTIONS_CACHE_TTL = 30.0  # Seconds before host device/network lists are re-queried
+    RESIZE_POLL = 0.5  # inkey timeout (seconds) while idle; bounds how late a resize repaints
+
+    STEP_TITLES = (
+        "Basic Information",
+        "Resources",
+        "Operating System",
+        "Network",
+        "Display & GPU",
+        "Audio",
+        "USB Passthrough",
+        "Review & Create",
+    )
+    FOOTER_HINT = "Tab/↑↓: navigate  ←→: edit/select  Enter: confirm  Ctrl+R: rescan devices"
+
+    # Display names used on the review step
+    GRAPHICS_NAMES = {
+        "spice": "SPICE",
+        "vnc": "VNC",
+        "none": "None (Headless)",
+    }
+    AUDIO_NAMES = {
+        "none": "None",
+        "ac97": "AC97",
+        "ich6": "Intel ICH6",
+        "ich9": "Intel ICH9",
+    }
+
     def __init__(
         self,
         term: Terminal,
@@ -46,6 +90,13 @@ class CreateWizard:
 
         # Get system resources
         self.resources: SystemResources = self.system_service.get_resources()
+        # IOMMU state only changes across reboots
+        self._iommu_enabled = self.gpu_service.check_iommu_enabled()
+        # Host CPU count is fixed for the session
+        self._cpu_pinning_options = self._build_cpu_pinning_options()
+        self._cpu_pinning_prompt = (
+            f"Enter CPU list (e.g., 0-3 or 0,2,4,6) [0-{self.resources.cpu_count - 1}]:"
+        )
 
         # Wizard state
         self.step = 0
@@ -66,29 +117,77 @@ class CreateWizard:
         # Step data
         self.available_networks: list[str] = []
         self.available_gpus: list[GPUDevice] = []
+        self._gpu_by_addr: dict[str, GPUDevice] = {}  # available_gpus indexed by PCI address
         self.available_usb: list[USBDevice] = []
+        self._usb_by_id: dict[str, USBDevice] = {}  # available_usb indexed by vendor:product ID
         self.iso_files: list[Path] = []
+        self._existing_vm_names: set[str] = set()
+        self._network_options_cache: dict[bool, list[tuple[str, str]]] = {}  # include_ip -> options
+        self._gpu_select_options: list[tuple[str, str]] = [("none", "None")]
+        self._osinfo_options: list[tuple[str, str]] | None = None
+        self._iso_cache: tuple[float, list[Path]] | None = None  # (ISO_DIR mtime, files)
+        self._cache: dict[str, tuple[float, Any]] = {}  # key -> (timestamp, value)
+
+        # Rendering state: full clear+redraw only when the layout may have changed
+        self._dirty_full = True
+        self._drawn_size: tuple[int, int] | None = None
+        self._form_origin = (2, 3)  # Where the current form was last drawn
+        self._title_cache: dict[tuple[int, int], str] = {}  # (step, width) -> centered title
+        self._hint_cache: tuple[int, str] = (-1, "")  # (width, centered footer hint)
+
+        # Forms for each step, built on first access (see _form)
+        self._form_factories: list[Callable[[], Form]] = [
+            self._make_step0_form,
+            self._make_step1_form,
+            self._make_step2_form,
+            self._make_step3_form,
+            self._make_step4_form,
+            self._make_step5_form,
+            self._make_step6_form,
+            self._make_step7_form,
+        ]
+        self.forms: list[Form | None] = [None] * len(self._form_factories)
+
+        # Per-step form <-> config transfer (USB devices are saved by the dialog)
+        self._step_savers: dict[int, Callable[[dict[str, str]], None]] = {
+            0: self._save_basic,
+            1: self._save_resources,
+            2: self._save_os,
+            3: self._save_network,
+            4: self._save_display,
+            5: self._save_audio,
+            7: self._save_review,
+        }
+        self._step_loaders: list[Callable[[], None]] = [
+            self._load_basic,
+            self._load_resources,
+            self._load_os,
+            self._load_network,
+            self._load_display,
+            self._load_audio,
+            self._load_usb,
+            self._load_review,
+        ]
 
-        # Forms for each step
-        self.forms: list[Form] = []
-        self._init_forms()
+    def _form(self, step: int) -> Form:
+        """Get the form for a step, building it on first access."""
+        form = self.forms[step]
+        if form is None:
+            form = self._form_factories[step]()
+            self.forms[step] = form
+        return form
 
-    def _init_forms(self) -> None:
-        """Initialize forms for each step."""
-        # Step 0: Basic info
+    def _make_step0_form(self) -> Form:
+        """Build the basic information form."""
         def validate_name(x: str) -> str | None:
             if not x:
                 return "Name is required"
-            # Check if VM name already exists
-            try:
-                existing_vms = self.libvirt.list_vms()
-                if any(vm.name == x for vm in existing_vms):
-                    return f"VM '{x}' already exists"
-            except Exception:
-                pass  # If we can't check, allow it (will fail later with better error)
+            # Check if VM name already exists (names are fetched by refresh_existing_names)
+            if x in self._existing_vm_names:
+                return f"VM '{x}' already exists"
             return None
 
-        self.forms.append(Form(
+        return Form(
             self.term,
             self.theme,
             fields=[
@@ -101,53 +200,57 @@ class CreateWizard:
                 ),
             ],
             buttons=[("cancel", "Cancel"), ("next", "Next")],
-        ))
+        )
 
-        # Step 1: Resources
+    def _make_step1_form(self) -> Form:
+        """Build the resources form."""
         max_cpus = self.resources.cpu_count
         max_mem = self.resources.memory_mb
         max_disk = self.resources.disk_free_gb
 
+        # Error messages are built once; NUMBER fields only accept digits, so
+        # isdigit() replaces the int()/ValueError round-trip
+        max_cpus_error = f"Max available: {max_cpus}"
+        max_mem_error = f"Max available: {max_mem}"
+        max_disk_error = f"Max available: {max_disk}"
+
         def validate_cpus(x: str) -> str | None:
             if not x:
                 return "Required"
-            try:
-                val = int(x)
-                if val < 1:
-                    return "Must be at least 1"
-                if val > max_cpus:
-                    return f"Max available: {max_cpus}"
-            except ValueError:
+            if not x.isdigit():
                 return "Invalid number"
+            val = int(x)
+            if val < 1:
+                return "Must be at least 1"
+            if val > max_cpus:
+                return max_cpus_error
             return None
 
         def validate_memory(x: str) -> str | None:
             if not x:
                 return "Required"
-            try:
-                val = int(x)
-                if val < 256:
-                    return "Must be at least 256"
-                if val > max_mem:
-                    return f"Max available: {max_mem}"
-            except ValueError:
+            if not x.isdigit():
                 return "Invalid number"
+            val = int(x)
+            if val < 256:
+                return "Must be at least 256"
+            if val > max_mem:
+                return max_mem_error
             return None
 
         def validate_disk(x: str) -> str | None:
             if not x:
                 return "Required"
-            try:
-                val = int(x)
-                if val < 1:
-                    return "Must be at least 1"
-                if val > max_disk:
-                    return f"Max available: {max_disk}"
-            except ValueError:
+            if not x.isdigit():
                 return "Invalid number"
+            val = int(x)
+            if val < 1:
+                return "Must be at least 1"
+            if val > max_disk:
+                return max_disk_error
             return None
 
-        self.forms.append(Form(
+        return Form(
             self.term,
             self.theme,
             fields=[
@@ -181,10 +284,11 @@ class CreateWizard:
                 ),
             ],
             buttons=[("cancel", "Cancel"), ("prev", "Previous"), ("next", "Next")],
-        ))
+        )
 
-        # Step 2: OS & Media
-        self.forms.append(Form(
+    def _make_step2_form(self) -> Form:
+        """Build the OS & media form."""
+        return Form(
             self.term,
             self.theme,
             fields=[
@@ -203,10 +307,11 @@ class CreateWizard:
                 ),
             ],
             buttons=[("cancel", "Cancel"), ("prev", "Previous"), ("next", "Next")],
-        ))
+        )
 
-        # Step 3: Network
-        self.forms.append(Form(
+    def _make_step3_form(self) -> Form:
+        """Build the network form."""
+        return Form(
             self.term,
             self.theme,
             fields=[
@@ -214,7 +319,8 @@ class CreateWizard:
                     name="network",
                     label="Network:",
                     field_type=FieldType.SELECT,
-                    value=DEFAULT_NETWORK,
+                    value=self.config.network,
+                    options=self._get_network_options(),
                     placeholder="Press Enter to select...",
                 ),
                 FormField(
@@ -222,21 +328,16 @@ class CreateWizard:
                     label="NIC Model:",
                     field_type=FieldType.SELECT,
                     value="virtio",
-                    options=[
-                        ("virtio", "VirtIO (Best performance)"),
-                        ("e1000e", "Intel e1000e (Good compatibility)"),
-                        ("e1000", "Intel e1000 (Legacy)"),
-                        ("rtl8139", "Realtek RTL8139 (Wide compatibility)"),
-                        ("vmxnet3", "VMware vmxnet3"),
-                    ],
+                    options=NIC_MODEL_OPTIONS,
                     recommended=["virtio", "e1000e"],
                 ),
             ],
             buttons=[("cancel", "Cancel"), ("prev", "Previous"), ("next", "Next")],
-        ))
+        )
 
-        # Step 4: Display & GPU (combined for clarity)
-        self.forms.append(Form(
+    def _make_step4_form(self) -> Form:
+        """Build the display & GPU form."""
+        return Form(
             self.term,
             self.theme,
             fields=[
@@ -245,6 +346,7 @@ class CreateWizard:
                     label="GPU Passthrough:",
                     field_type=FieldType.SELECT,
                     value="none",
+                    options=self._gpu_select_options,
                     placeholder="Press Enter to select GPUs...",
                 ),
                 FormField(
@@ -252,19 +354,16 @@ class CreateWizard:
                     label="Remote Access:",
                     field_type=FieldType.SELECT,
                     value="spice",
-                    options=[
-                        ("spice", "SPICE - Remote desktop (recommended)"),
-                        ("vnc", "VNC - Basic remote viewer"),
-                        ("none", "None - Serial console only"),
-                    ],
+                    options=GRAPHICS_OPTIONS,
                     recommended=["spice"],
                 ),
             ],
             buttons=[("cancel", "Cancel"), ("prev", "Previous"), ("next", "Next")],
-        ))
+        )
 
-        # Step 5: Audio
-        self.forms.append(Form(
+    def _make_step5_form(self) -> Form:
+        """Build the audio form."""
+        return Form(
             self.term,
             self.theme,
             fields=[
@@ -273,20 +372,16 @@ class CreateWizard:
                     label="Audio Device:",
                     field_type=FieldType.SELECT,
                     value="ich9",
-                    options=[
-                        ("ich9", "Intel ICH9 (Recommended)"),
-                        ("ich6", "Intel ICH6"),
-                        ("ac97", "AC97 (Legacy)"),
-                        ("none", "None"),
-                    ],
+                    options=AUDIO_OPTIONS,
                     recommended=["ich9"],
                 ),
             ],
             buttons=[("cancel", "Cancel"), ("prev", "Previous"), ("next", "Next")],
-        ))
+        )
 
-        # Step 6: USB Passthrough
-        self.forms.append(Form(
+    def _make_step6_form(self) -> Form:
+        """Build the USB passthrough form."""
+        return Form(
             self.term,
             self.theme,
             fields=[
@@ -299,10 +394,11 @@ class CreateWizard:
                 ),
             ],
             buttons=[("cancel", "Cancel"), ("prev", "Previous"), ("next", "Next")],
-        ))
+        )
 
-        # Step 7: Review
-        self.forms.append(Form(
+    def _make_step7_form(self) -> Form:
+        """Build the review form."""
+        return Form(
             self.term,
             self.theme,
             fields=[
@@ -315,120 +411,252 @@ class CreateWizard:
                 ),
             ],
             buttons=[("cancel", "Cancel"), ("prev", "Previous"), ("create", "Create")],
-        ))
+        )
+
+    def _build_cpu_pinning_options(self) -> list[tuple[str, str]]:
+        """Build the CPU pinning choices for the host CPU count."""
+        max_cpus = self.resources.cpu_count
+        options: list[tuple[str, str]] = [("none", "None - No CPU pinning")]
+
+        # Add common pinning patterns
+        if max_cpus >= 2:
+            options.append(("0-1", "CPUs 0-1 (first 2 cores)"))
+        if max_cpus >= 4:
+            options.append(("0-3", "CPUs 0-3 (first 4 cores)"))
+        if max_cpus >= 8:
+            options.append(("0-7", "CPUs 0-7 (first 8 cores)"))
+        if max_cpus >= 4:
+            # Even cores for NUMA-like behavior
+            even = ",".join(str(i) for i in range(0, min(max_cpus, 8), 2))
+            options.append((even, f"CPUs {even} (even cores)"))
+
+        # Custom option
+        options.append(("custom", "Custom (enter manually)"))
+        return options
+
+    def refresh_existing_names(self) -> None:
+        """Fetch the names of existing VMs used by name validation."""
+        try:
+            self._existing_vm_names = {vm.name for vm in self.libvirt.list_vms()}
+        except Exception:
+            # If we can't check, allow any name (will fail later with better error)
+            self._existing_vm_names = set()
+
+    def _cached(self, key: str, fetch: Callable[[], T]) -> T:
+        """Return a cached host query result, re-fetching after OPTIONS_CACHE_TTL."""
+        now = time.monotonic()
+        entry = self._cache.get(key)
+        if entry is not None and now - entry[0] < self.OPTIONS_CACHE_TTL:
+            return cast(T, entry[1])
+        value = fetch()
+        self._cache[key] = (now, value)
+        return value
 
     def run(self) -> VMConfig | None:
         """Run the wizard. Returns config or None if cancelled."""
         # Load available options
+        self.refresh_existing_names()
         self._load_options()
 
-        with self.term.cbreak(), self.term.hidden_cursor():
-            while True:
-                self._render()
-
-                key: Keystroke = self.term.inkey(timeout=0.1)
-                if not key:
-                    continue
+        # Select retries after signals, so a resize would not wake inkey(); flag
+        # it and chain to the app's handler so its own size check still runs
+        prev_resize = signal.getsignal(signal.SIGWINCH)
 
-                result = self._handle_key(key)
-                if result == "cancel":
-                    return None
-                elif result == "complete":
-                    return self.config
+        def handle_resize(signum: int, frame: Any) -> None:
+            self._dirty_full = True
+            if callable(prev_resize):
+                prev_resize(signum, frame)
 
-    def _load_options(self) -> None:
-        """Load available options for selects."""
-        # Networks - include both bridges and libvirt networks
-        network_options: list[tuple[str, str]] = []
-
-        # Add host bridges first
-        for bridge in self.network_service.list_bridges():
-            network_options.append((f"bridge:{bridge}", f"{bridge} (bridge)"))
+        signal.signal(signal.SIGWINCH, handle_resize)
+        try:
+            with self.term.cbreak(), self.term.hidden_cursor():
+                self._render()
+                while True:
+                    # Nothing animates here; wake only to pick up a resize
+                    key: Keystroke = self.term.inkey(timeout=self.RESIZE_POLL)
+                    if not key:
+                        if self._dirty_full:
+                            self._render()
+                        continue
+
+                    result = self._handle_key(key)
+                    if result == "cancel":
+                        return None
+                    elif result == "complete":
+                        return self.config
+
+                    self._render()
+        finally:
+            if prev_resize is not None:
+                signal.signal(signal.SIGWINCH, prev_resize)
+
+    def _get_network_options(self, include_ip: bool = False) -> list[tuple[str, str]]:
+        """Return host bridges followed by libvirt networks as select options.
+
+        Results are kept for the rest of the wizard session; Ctrl+R clears them.
+        """
+        cached = self._network_options_cache.get(include_ip)
+        if cached is not None:
+            return cached
+
+        # Host bridges first (usually preferred for direct network access)
+        bridges = self._cached("bridges", self.network_service.list_bridges)
+        options: list[tuple[str, str]]
+        if include_ip:
+            bridge_infos = self._cached(
+                "bridge_info", lambda: self.network_service.get_all_bridge_info(bridges)
+            )
+            options = [
+                (f"bridge:{bridge}", f"{bridge} (host bridge - {info['ip']})" if info.get("ip")
+                 else f"{bridge} (host bridge)")
+                for bridge, info in bridge_infos.items()
+            ]
+        else:
+            options = [(f"bridge:{bridge}", f"{bridge} (bridge)") for bridge in bridges]
 
         # Add libvirt networks
         try:
-            for net in self.libvirt.list_networks():
-                network_options.append((f"network:{net}", f"{net} (libvirt)"))
+            net_suffix = "libvirt network" if include_ip else "libvirt"
+            options.extend(
+                (f"network:{net}", f"{net} ({net_suffix})")
+                for net in self._cached("networks", self.libvirt.list_networks)
+            )
         except Exception:
             pass
 
-        # Set default to first bridge if available, otherwise first network
+        self._network_options_cache[include_ip] = options
+        return options
+
+    def _load_options(self) -> None:
+        """Load available options for selects."""
+        # Set default network to first bridge if available, otherwise first network
+        network_options = self._get_network_options()
         if network_options:
-            self.forms[3].fields[0].options = network_options
             default = network_options[0][0]
-            if default.startswith("bridge:"):
+            if (name := default.removeprefix("bridge:")) != default:
                 self.config.network_type = "bridge"
-                self.config.network = default[7:]
+                self.config.network = name
             else:
                 self.config.network_type = "network"
-                self.config.network = default[8:]
-            self.forms[3].set_value("network", network_options[0][1].split(" ")[0])
+                self.config.network = default.removeprefix("network:")
 
         # GPUs
-        self.available_gpus = self.gpu_service.list_gpus()
-        gpu_options: list[tuple[str, str]] = [("none", "None")]
-        if self.gpu_service.check_iommu_enabled():
-            for gpu in self.available_gpus:
-                gpu_options.append((gpu.pci_address, gpu.full_description))
-        self.forms[4].fields[0].options = gpu_options
+        self._refresh_gpu_select_options()
 
         # ISO files
-        if ISO_DIR.exists():
-            self.iso_files = sorted(ISO_DIR.glob("*.iso"))
+        self.iso_files = self._list_iso_files()
+
+    def _refresh_gpu_select_options(self) -> None:
+        """Rebuild the GPU field's choices from the current GPU list."""
+        self._refresh_gpus()
+        gpu_options: list[tuple[str, str]] = [("none", "None")]
+        if self._iommu_enabled:
+            gpu_options.extend((gpu.pci_address, gpu.full_description) for gpu in self.available_gpus)
+        self._gpu_select_options = gpu_options
+
+    def _rescan_host_options(self) -> None:
+        """Drop cached host queries and refresh the choices of forms already built."""
+        self._cache.clear()
+        self._iso_cache = None
+        self._network_options_cache.clear()
+        self.iso_files = self._list_iso_files()
+
+        # Forms keep their options list, so swap in the new ones; entered values stay
+        self._refresh_gpu_select_options()
+        network_form = self.forms[3]
+        if network_form is not None:
+            network_form.fields_by_name["network"].options = self._get_network_options()
+        gpu_form = self.forms[4]
+        if gpu_form is not None:
+            gpu_form.fields_by_name["gpu"].options = self._gpu_select_options
+        self._dirty_full = True
+
+    def _refresh_gpus(self) -> None:
+        """Load available GPUs and index them by PCI address."""
+        self.available_gpus = self._cached("gpus", self.gpu_service.list_gpus)
+        self._gpu_by_addr = {g.pci_address: g for g in self.available_gpus}
+
+    def _selected_gpu_text(self) -> str:
+        """Describe the selected GPUs by name, falling back to a device count."""
+        # Only actual GPUs have names here, not audio devices etc. from their groups
+        gpu_names = [
+            gpu.display_name
+            for addr in self.config.gpu_devices
+            if (gpu := self._gpu_by_addr.get(addr))
+        ]
+        return ", ".join(gpu_names) if gpu_names else f"{len(self.config.gpu_devices)} device(s)"
+
+    def _list_iso_files(self) -> list[Path]:
+        """List ISO files in the ISO directory, re-scanning only when it was modified."""
+        try:
+            mtime = ISO_DIR.stat().st_mtime
+        except FileNotFoundError:
+            self._iso_cache = (0.0, [])
+            return []
+
+        if self._iso_cache is None or self._iso_cache[0] != mtime:
+            try:
+                with os.scandir(ISO_DIR) as entries:
+                    iso_files = sorted(
+                        Path(entry.path)
+                        for entry in entries
+                        if entry.name.endswith(".iso") and entry.is_file()
+                    )
+            except FileNotFoundError:
+                iso_files = []
+            self._iso_cache = (mtime, iso_files)
+        return self._iso_cache[1]
 
     def _render(self) -> None:
         """Render the current wizard step."""
-        print(self.term.home + self.term.clear, end="")
+        form = self._form(self.step)
+        size = (self.term.width, self.term.height)
+
+        # Only the focused field/value changed - repaint just that part of the form
+        if not self._dirty_full and size == self._drawn_size:
+            x, y = self._form_origin
+            form.render_dirty(x, y, self.term.width - 4)
+            sys.stdout.flush()
+            return
+
+        self._dirty_full = False
+        self._drawn_size = size
+        # Everything is cursor-addressed, so the chrome goes out as one write
+        # ahead of the form regardless of where it sits on screen
+        buf = [self.term.home + self.term.clear]
 
         # Header
-        step_titles = [
-            "Basic Information",
-            "Resources",
-            "Operating System",
-            "Network",
-            "Display & GPU",
-            "Audio",
-            "USB Passthrough",
-            "Review & Create",
-        ]
-        title = f" Create VM - {step_titles[self.step]} ({self.step + 1}/{self.total_steps}) "
-        print(
-            self.term.move_xy(0, 0)
-            + self.term.black_on_cyan(title.center(self.term.width)),
-            end="",
-        )
+        width = size[0]
+        title_key = (self.step, width)
+        title = self._title_cache.get(title_key)
+        if title is None:
+            title = (
+                f" Create VM - {self.STEP_TITLES[self.step]} ({self.step + 1}/{self.total_steps}) "
+            ).center(width)
+            self._title_cache[title_key] = title
+        buf.append(self.term.move_xy(0, 0) + self.term.black_on_cyan(title))
 
         # Form content
         y = 3
-        form = self.forms[self.step]
 
         if self.step == 7:
             # Review step - show summary
-            y = self._render_review(y)
-            # Render just the buttons
-            form.render(2, y + 2, self.term.width - 4)
-        else:
-            form.render(2, y, self.term.width - 4)
+            review, y = self._render_review(y)
+            buf.append(review)
+            y += 2
+        self._form_origin = (2, y)
 
         # Footer hint
-        hint = "Tab/↑↓: navigate  ←→: edit/select  Enter: confirm"
-        print(
-            self.term.move_xy(0, self.term.height - 1)
-            + self.theme.dim(hint.center(self.term.width)),
-            end="",
-        )
-
-        print("", end="", flush=True)
+        if self._hint_cache[0] != width:
+            self._hint_cache = (width, self.FOOTER_HINT.center(width))
+        buf.append(self.term.move_xy(0, size[1] - 1) + self.theme.dim(self._hint_cache[1]))
 
-    def _render_review(self, y: int) -> int:
-        """Render review summary. Returns y position after."""
-        # Display names
-        graphics_names = {
-            "spice": "SPICE",
-            "vnc": "VNC",
-            "none": "None (Headless)",
-        }
+        sys.stdout.write("".join(buf))
+        form.render(2, y, self.term.width - 4)
+        sys.stdout.flush()
 
+    def _render_review(self, y: int) -> tuple[str, int]:
+        """Render review summary. Returns the output and the y position after."""
         cpu_info = str(self.config.vcpus)
         if self.config.cpu_pinning:
             cpu_info += f" (pinned: {self.config.cpu_pinning})"
@@ -441,20 +669,12 @@ class CreateWizard:
             ("OS Variant:", self.config.os_variant),
             ("Network:", f"{self.config.network} ({self.config.network_type}, {self.config.nic_model})"),
             ("ISO:", self.config.iso_path.name if self.config.iso_path else "None"),
-            ("Display:", graphics_names.get(self.config.graphics, "Unknown")),
+            ("Display:", self.GRAPHICS_NAMES.get(self.config.graphics, "Unknown")),
         ]
 
         if self.config.gpu_devices:
             # Show GPU names
-            gpu_names = []
-            for addr in self.config.gpu_devices:
-                gpu = self.gpu_service.get_gpu_by_address(addr)
-                if gpu:
-                    gpu_names.append(gpu.display_name)
-            if gpu_names:
-                gpu_text = ", ".join(gpu_names)
-            else:
-                gpu_text = f"{len(self.config.gpu_devices)} device(s)"
+            gpu_text = self._selected_gpu_text()
             if self.config.graphics != "none":
                 gpu_text += f" + {self.config.graphics.upper()}"
             values.append(("GPU:", gpu_text))
@@ -462,13 +682,7 @@ class CreateWizard:
             values.append(("GPU:", "None"))
 
         # Audio
-        audio_names = {
-            "none": "None",
-            "ac97": "AC97",
-            "ich6": "Intel ICH6",
-            "ich9": "Intel ICH9",
-        }
-        values.append(("Audio:", audio_names.get(self.config.audio_model, "None")))
+        values.append(("Audio:", self.AUDIO_NAMES.get(self.config.audio_model, "None")))
 
         # USB
         if self.config.usb_devices:
@@ -476,15 +690,21 @@ class CreateWizard:
         else:
             values.append(("USB:", "None"))
 
+        lines: list[str] = []
         for label, value in values:
-            print(self.term.move_xy(2, y) + f"{label:15} {value}", end="")
+            lines.append(self.term.move_xy(2, y) + f"{label:15} {value}")
             y += 1
 
-        return y
+        return "".join(lines), y
 
     def _handle_key(self, key: Keystroke) -> str | None:
         """Handle key input. Returns 'cancel', 'complete', or None."""
-        form = self.forms[self.step]
+        # Ctrl+R re-scans host devices, networks and ISOs
+        if key == "\x12":
+            self._rescan_host_options()
+            return None
+
+        form = self._form(self.step)
         result = form.handle_key(key)
 
         if result is None:
@@ -494,6 +714,8 @@ class CreateWizard:
         if result.startswith("select:"):
             field_name = result.split(":")[1]
             self._handle_select(field_name)
+            # Dialogs draw over the wizard
+            self._dirty_full = True
             return None
 
         # Handle button presses
@@ -502,11 +724,15 @@ class CreateWizard:
         elif result == "prev":
             self._save_step_values()
             self.step = max(0, self.step - 1)
+            self._dirty_full = True
+            if self.step == 0:
+                self.refresh_existing_names()
             self._load_step_values()
         elif result == "next":
             if form.validate():
                 self._save_step_values()
                 self.step += 1
+                self._dirty_full = True
                 self._load_step_values()
         elif result == "create":
             if form.validate():
@@ -524,8 +750,8 @@ class CreateWizard:
         auto_next: bool = True,
     ) -> str | None:
         """Show a SearchSelect dialog for a form field. Returns selected value."""
-        form = self.forms[form_idx]
-        field = next((f for f in form.fields if f.name == field_name), None)
+        form = self._form(form_idx)
+        field = form.fields_by_name.get(field_name)
         if not field:
             return None
 
@@ -561,27 +787,17 @@ class CreateWizard:
     def _handle_select(self, field_name: str) -> None:
         """Handle select field activation."""
         if field_name == "os_variant":
-            # Show fuzzy search dialog for OS variants
-            variants = self.osinfo_service.list_variants()
-            options = [(v.short_id, f"{v.short_id} - {v.name}") for v in variants]
-            self._show_field_dialog(2, "os_variant", "Select OS Variant", options)
+            # Show fuzzy search dialog for OS variants (options built once per wizard)
+            if self._osinfo_options is None:
+                self._osinfo_options = [
+                    (v.short_id, f"{v.short_id} - {v.name}")
+                    for v in self.osinfo_service.list_variants()
+                ]
+            self._show_field_dialog(2, "os_variant", "Select OS Variant", self._osinfo_options)
 
         elif field_name == "network":
-            # Build network options from both libvirt networks and host bridges
-            options: list[tuple[str, str]] = []
-
-            # Add host bridges first (usually preferred for direct network access)
-            for bridge in self.network_service.list_bridges():
-                info = self.network_service.get_bridge_info(bridge)
-                ip_info = f" - {info.get('ip', 'no IP')}" if info.get('ip') else ""
-                options.append((f"bridge:{bridge}", f"{bridge} (host bridge{ip_info})"))
-
-            # Add libvirt networks
-            try:
-                for net in self.libvirt.list_networks():
-                    options.append((f"network:{net}", f"{net} (libvirt network)"))
-            except Exception:
-                pass
+            # Host bridges (with their IPs) and libvirt networks
+            options = self._get_network_options(include_ip=True)
 
             if not options:
                 from vm_manager.ui.widgets.dialog import MessageDialog
@@ -603,17 +819,16 @@ class CreateWizard:
             result = dialog.show()
             if result:
                 # Parse result to get type and name
-                if result.startswith("bridge:"):
+                if (name := result.removeprefix("bridge:")) != result:
                     self.config.network_type = "bridge"
-                    self.config.network = result[7:]  # Remove "bridge:" prefix
+                    self.config.network = name
                 else:
                     self.config.network_type = "network"
-                    self.config.network = result[8:]  # Remove "network:" prefix
+                    self.config.network = result.removeprefix("network:")
 
                 # Update display
-                display_name = result.split(":", 1)[1]
-                self.forms[3].set_value("network", display_name)
-                self.forms[3]._focus_next()
+                self._form(3).set_value("network", self.config.network)
+                self._form(3)._focus_next()
 
         elif field_name == "nic_model":
             # Show NIC model options dialog
@@ -629,29 +844,11 @@ class CreateWizard:
 
         elif field_name == "cpu_pinning":
             # Show CPU pinning options
-            max_cpus = self.resources.cpu_count
-            options: list[tuple[str, str]] = [("none", "None - No CPU pinning")]
-
-            # Add common pinning patterns
-            if max_cpus >= 2:
-                options.append(("0-1", "CPUs 0-1 (first 2 cores)"))
-            if max_cpus >= 4:
-                options.append(("0-3", "CPUs 0-3 (first 4 cores)"))
-            if max_cpus >= 8:
-                options.append(("0-7", "CPUs 0-7 (first 8 cores)"))
-            if max_cpus >= 4:
-                # Even cores for NUMA-like behavior
-                even = ",".join(str(i) for i in range(0, min(max_cpus, 8), 2))
-                options.append((even, f"CPUs {even} (even cores)"))
-
-            # Custom option
-            options.append(("custom", "Custom (enter manually)"))
-
             dialog = SearchSelect(
                 self.term,
                 self.theme,
                 "Select CPU Pinning",
-                options,
+                self._cpu_pinning_options,
             )
             result = dialog.show()
 
@@ -662,28 +859,28 @@ class CreateWizard:
                     self.term,
                     self.theme,
                     "Custom CPU Pinning",
-                    f"Enter CPU list (e.g., 0-3 or 0,2,4,6) [0-{max_cpus-1}]:",
+                    self._cpu_pinning_prompt,
                     "",
                 )
                 custom_value = input_dialog.show()
                 if custom_value:
                     self.config.cpu_pinning = custom_value
-                    self.forms[1].set_value("cpu_pinning", custom_value)
-                    self.forms[1]._focus_next()
+                    self._form(1).set_value("cpu_pinning", custom_value)
+                    self._form(1)._focus_next()
             elif result and result != "none":
                 self.config.cpu_pinning = result
-                self.forms[1].set_value("cpu_pinning", result)
-                self.forms[1]._focus_next()
+                self._form(1).set_value("cpu_pinning", result)
+                self._form(1)._focus_next()
             elif result == "none":
                 self.config.cpu_pinning = ""
-                self.forms[1].set_value("cpu_pinning", "none")
-                self.forms[1]._focus_next()
+                self._form(1).set_value("cpu_pinning", "none")
+                self._form(1)._focus_next()
 
         elif field_name == "gpu":
-            # Refresh GPU list - Multi-select like USB
-            self.available_gpus = self.gpu_service.list_gpus()
+            # GPU list - Multi-select like USB
+            self._refresh_gpus()
 
-            if not self.gpu_service.check_iommu_enabled():
+            if not self._iommu_enabled:
                 if self.available_gpus:
                     from vm_manager.ui.widgets.dialog import MessageDialog
                     MessageDialog(
@@ -709,10 +906,13 @@ class CreateWizard:
             # Create options list with disabled flag for non-vfio GPUs
             from vm_manager.ui.widgets.dialog import ToggleListDialog
 
+            # IOMMU groups for every device, from a single sysfs sweep
+            iommu_map = self._cached("iommu_groups", self.gpu_service.get_all_iommu_groups)
+
             gpu_options: list[tuple[str, str, bool]] = []
             for gpu in self.available_gpus:
                 # Get IOMMU group info
-                group = self.gpu_service.get_iommu_group(gpu.pci_address)
+                group = iommu_map.get(gpu.pci_address)
                 if group and len(group.devices) > 1:
                     device_types = [d.device_type for d in group.devices]
                     type_summary = ", ".join(sorted(set(device_types)))
@@ -742,41 +942,33 @@ class CreateWizard:
 
             result = dialog.show()
 
+            if result is None:
+                return
+
             # Process selections - add entire IOMMU groups
             new_selected: list[str] = []
+            seen: set[str] = set()
             for addr in result:
-                group = self.gpu_service.get_iommu_group(addr)
+                group = iommu_map.get(addr)
                 group_addrs = group.pci_addresses if group else [addr]
                 for group_addr in group_addrs:
-                    if group_addr not in new_selected:
+                    if group_addr not in seen:
+                        seen.add(group_addr)
                         new_selected.append(group_addr)
 
             self.config.gpu_devices = new_selected
 
             # Update form display with GPU names
             if self.config.gpu_devices:
-                # Get names of selected GPUs (only actual GPUs, not audio devices etc)
-                gpu_names = []
-                for addr in self.config.gpu_devices:
-                    gpu = next((g for g in self.available_gpus if g.pci_address == addr), None)
-                    if gpu:
-                        gpu_names.append(gpu.display_name)
-                if gpu_names:
-                    display_text = ", ".join(gpu_names)
-                else:
-                    display_text = f"{len(self.config.gpu_devices)} device(s)"
-                self.forms[4].set_value("gpu", display_text)
+                self._form(4).set_value("gpu", self._selected_gpu_text())
             else:
-                self.forms[4].set_value("gpu", "none")
+                self._form(4).set_value("gpu", "none")
             # Auto advance after multi-select
-            self.forms[4]._focus_next()
+            self._form(4)._focus_next()
 
         elif field_name == "iso_path":
-            # Refresh ISO file list
-            if ISO_DIR.exists():
-                self.iso_files = sorted(ISO_DIR.glob("*.iso"))
-            else:
-                self.iso_files = []
+            # ISO file list
+            self.iso_files = self._list_iso_files()
 
             # Show ISO file selector
             if self.iso_files:
@@ -789,9 +981,9 @@ class CreateWizard:
                 )
                 result = dialog.show()
                 if result:
-                    self.forms[2].fields[1].value = Path(result).name
+                    self._form(2).fields_by_name["iso_path"].value = Path(result).name
                     self.config.iso_path = Path(result)
-                    self.forms[2]._focus_next()
+                    self._form(2)._focus_next()
             else:
                 # Show message that no ISOs were found
                 from vm_manager.ui.widgets.dialog import MessageDialog
@@ -804,17 +996,18 @@ class CreateWizard:
                 ).show()
 
         elif field_name == "usb":
-            # Refresh USB device list
-            self.available_usb = self.usb_service.list_devices()
+            # USB device list
+            self.available_usb = self._cached("usb", self.usb_service.list_devices)
+            self._usb_by_id = {u.id_string: u for u in self.available_usb}
 
             if self.available_usb:
                 # Create multi-select style list
-                options: list[tuple[str, str]] = []
-                for usb in self.available_usb:
-                    # Mark if already selected
-                    selected = usb.id_string in self.config.usb_devices
-                    prefix = "[X] " if selected else "[ ] "
-                    options.append((usb.id_string, f"{prefix}{usb.full_description}"))
+                selected_ids = set(self.config.usb_devices)
+                options: list[tuple[str, str]] = [
+                    (usb.id_string, f"{'[X] ' if usb.id_string in selected_ids else '[ ] '}{usb.full_description}")
+                    for usb in self.available_usb
+                ]
+                row_by_id = {val: i for i, (val, _) in enumerate(options)}
 
                 dialog = SearchSelect(
                     self.term,
@@ -830,28 +1023,28 @@ class CreateWizard:
                         break
 
                     # Toggle selection
-                    if result in self.config.usb_devices:
+                    if result in selected_ids:
+                        selected_ids.discard(result)
                         self.config.usb_devices.remove(result)
+                        prefix = "[ ] "
                     else:
+                        selected_ids.add(result)
                         self.config.usb_devices.append(result)
+                        prefix = "[X] "
 
-                    # Update display
-                    for i, (val, display) in enumerate(options):
-                        selected = val in self.config.usb_devices
-                        prefix = "[X] " if selected else "[ ] "
-                        usb = next((u for u in self.available_usb if u.id_string == val), None)
-                        if usb:
-                            options[i] = (val, f"{prefix}{usb.full_description}")
-                    dialog.all_options = options
+                    # Update display - only the toggled row changed
+                    usb = self._usb_by_id.get(result)
+                    if usb:
+                        options[row_by_id[result]] = (result, f"{prefix}{usb.full_description}")
                     dialog.filtered_options = options.copy()
 
                 # Update form display
                 if self.config.usb_devices:
-                    self.forms[6].set_value("usb", f"{len(self.config.usb_devices)} selected")
+                    self._form(6).set_value("usb", f"{len(self.config.usb_devices)} selected")
                 else:
-                    self.forms[6].set_value("usb", "none")
+                    self._form(6).set_value("usb", "none")
                 # Auto advance after multi-select
-                self.forms[6]._focus_next()
+                self._form(6)._focus_next()
             else:
                 from vm_manager.ui.widgets.dialog import MessageDialog
                 MessageDialog(
@@ -868,74 +1061,94 @@ class CreateWizard:
 
     def _save_step_values(self) -> None:
         """Save current form values to config."""
-        values = self.forms[self.step].get_values()
-
-        if self.step == 0:
-            self.config.name = values.get("name", "")
-        elif self.step == 1:
-            self.config.vcpus = int(values.get("vcpus", str(DEFAULT_VCPUS)) or str(DEFAULT_VCPUS))
-            self.config.memory_mb = int(values.get("memory", str(DEFAULT_RAM_MB)) or str(DEFAULT_RAM_MB))
-            self.config.disk_size_gb = int(values.get("disk", str(DEFAULT_DISK_GB)) or str(DEFAULT_DISK_GB))
-            # cpu_pinning is set directly in _handle_select
-        elif self.step == 2:
-            self.config.os_variant = values.get("os_variant", DEFAULT_OS_VARIANT)
-            # iso_path is set directly in _handle_select
-        elif self.step == 3:
-            # Network is set directly in _handle_select
-            self.config.nic_model = values.get("nic_model", "virtio")
-        elif self.step == 4:
-            # GPU devices are set directly in _handle_select with multi-select
-            self.config.graphics = values.get("graphics", "spice")
-        elif self.step == 5:
-            self.config.audio_model = values.get("audio", "ich9")
-        elif self.step == 6:
-            # USB devices are set directly in _handle_select
-            pass
-        elif self.step == 7:
-            self.config.autostart = values.get("autostart", "no") == "yes"
+        saver = self._step_savers.get(self.step)
+        if saver is not None:
+            saver(self._form(self.step).get_values())
+
+    def _save_basic(self, values: dict[str, str]) -> None:
+        """Save the basic information step."""
+        self.config.name = values.get("name", "")
+
+    def _save_resources(self, values: dict[str, str]) -> None:
+        """Save the resources step."""
+        self.config.vcpus = _parse_int(values.get("vcpus"), DEFAULT_VCPUS)
+        self.config.memory_mb = _parse_int(values.get("memory"), DEFAULT_RAM_MB)
+        self.config.disk_size_gb = _parse_int(values.get("disk"), DEFAULT_DISK_GB)
+        # cpu_pinning is set directly in _handle_select
+
+    def _save_os(self, values: dict[str, str]) -> None:
+        """Save the operating system step."""
+        self.config.os_variant = values.get("os_variant", DEFAULT_OS_VARIANT)
+        # iso_path is set directly in _handle_select
+
+    def _save_network(self, values: dict[str, str]) -> None:
+        """Save the network step."""
+        # Network is set directly in _handle_select
+        self.config.nic_model = values.get("nic_model", "virtio")
+
+    def _save_display(self, values: dict[str, str]) -> None:
+        """Save the display & GPU step."""
+        # GPU devices are set directly in _handle_select with multi-select
+        self.config.graphics = values.get("graphics", "spice")
+
+    def _save_audio(self, values: dict[str, str]) -> None:
+        """Save the audio step."""
+        self.config.audio_model = values.get("audio", "ich9")
+
+    def _save_review(self, values: dict[str, str]) -> None:
+        """Save the review step."""
+        self.config.autostart = values.get("autostart", "no") == "yes"
 
     def _load_step_values(self) -> None:
         """Load config values into current form."""
-        if self.step == 0:
-            self.forms[0].set_value("name", self.config.name)
-        elif self.step == 1:
-            self.forms[1].set_value("vcpus", str(self.config.vcpus))
-            self.forms[1].set_value("memory", str(self.config.memory_mb))
-            self.forms[1].set_value("disk", str(self.config.disk_size_gb))
-            if self.config.cpu_pinning:
-                self.forms[1].set_value("cpu_pinning", self.config.cpu_pinning)
-            else:
-                self.forms[1].set_value("cpu_pinning", "none")
-        elif self.step == 2:
-            self.forms[2].set_value("os_variant", self.config.os_variant)
-            if self.config.iso_path:
-                self.forms[2].fields[1].value = self.config.iso_path.name
-        elif self.step == 3:
-            self.forms[3].set_value("network", self.config.network)
-            self.forms[3].set_value("nic_model", self.config.nic_model)
-        elif self.step == 4:
-            # Combined Display & GPU step
-            if self.config.gpu_devices:
-                # Get names of selected GPUs
-                gpu_names = []
-                for addr in self.config.gpu_devices:
-                    gpu = self.gpu_service.get_gpu_by_address(addr)
-                    if gpu:
-                        gpu_names.append(gpu.display_name)
-                if gpu_names:
-                    display_text = ", ".join(gpu_names)
-                else:
-                    display_text = f"{len(self.config.gpu_devices)} device(s)"
-                self.forms[4].set_value("gpu", display_text)
-            else:
-                self.forms[4].set_value("gpu", "none")
-            self.forms[4].set_value("graphics", self.config.graphics)
-        elif self.step == 5:
-            self.forms[5].set_value("audio", self.config.audio_model)
-        elif self.step == 6:
-            if self.config.usb_devices:
-                self.forms[6].set_value("usb", f"{len(self.config.usb_devices)} selected")
-            else:
-                self.forms[6].set_value("usb", "none")
-        elif self.step == 7:
-            self.forms[7].set_value("autostart", "yes" if self.config.autostart else "no")
+        self._step_loaders[self.step]()
+
+    def _load_basic(self) -> None:
+        """Load the basic information step."""
+        self._form(0).set_value("name", self.config.name)
+
+    def _load_resources(self) -> None:
+        """Load the resources step."""
+        form = self._form(1)
+        form.set_value("vcpus", str(self.config.vcpus))
+        form.set_value("memory", str(self.config.memory_mb))
+        form.set_value("disk", str(self.config.disk_size_gb))
+        form.set_value("cpu_pinning", self.config.cpu_pinning or "none")
+
+    def _load_os(self) -> None:
+        """Load the operating system step."""
+        form = self._form(2)
+        form.set_value("os_variant", self.config.os_variant)
+        if self.config.iso_path:
+            form.fields_by_name["iso_path"].value = self.config.iso_path.name
+
+    def _load_network(self) -> None:
+        """Load the network step."""
+        form = self._form(3)
+        form.set_value("network", self.config.network)
+        form.set_value("nic_model", self.config.nic_model)
+
+    def _load_display(self) -> None:
+        """Load the display & GPU step."""
+        # Combined Display & GPU step
+        form = self._form(4)
+        if self.config.gpu_devices:
+            form.set_value("gpu", self._selected_gpu_text())
+        else:
+            form.set_value("gpu", "none")
+        form.set_value("graphics", self.config.graphics)
+
+    def _load_audio(self) -> None:
+        """Load the audio step."""
+        self._form(5).set_value("audio", self.config.audio_model)
+
+    def _load_usb(self) -> None:
+        """Load the USB passthrough step."""
+        if self.config.usb_devices:
+            self._form(6).set_value("usb", f"{len(self.config.usb_devices)} selected")
+        else:
+            self._form(6).set_value("usb", "none")
+
+    def _load_review(self) -> None:
+        """Load the review step."""
+        self._form(7).set_value("autostart", "yes" if self.config.autostart else "no")
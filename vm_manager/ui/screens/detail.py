@@ -1,12 +1,23 @@
 """VM detail/edit screen."""
 
+import signal
+import sys
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
 from typing import Any
 
 from blessed import Terminal
 from blessed.keyboard import Keystroke
 
-from vm_manager.config import DEFAULT_NETWORK
-from vm_manager.models import VM
+from vm_manager.config import (
+    AUDIO_OPTIONS,
+    AUTOSTART_OPTIONS,
+    DEFAULT_NETWORK,
+    GRAPHICS_OPTIONS,
+    NIC_MODEL_OPTIONS,
+)
+from vm_manager.models import VM, IOMMUGroup
 from vm_manager.services import GPUService, LibvirtService, NetworkService, USBService
 from vm_manager.services.system import SystemService, SystemResources
 from vm_manager.ui.theme import Theme
@@ -36,6 +47,8 @@ class DetailField:
 class VMDetailScreen:
     """Full-screen VM detail view with edit mode."""
 
+    RESIZE_POLL = 0.5  # inkey timeout (seconds) while idle; bounds how late a resize repaints
+
     def __init__(
         self,
         term: Terminal,
@@ -63,20 +76,33 @@ class VMDetailScreen:
         self.button_focused = False  # True when focus is on buttons
         self.selected_button = 0  # 0 = Cancel, 1 = Save
         self.changes: dict[str, Any] = {}
+        self._batch_depth = 0  # Nesting level of _batch() blocks
 
         # Track GPU selections
         self.selected_gpus: list[str] = list(vm.gpu_devices) if vm.gpu_devices else []
         self.available_gpus = self.gpu_service.list_gpus()
+        self._gpu_by_addr = {g.pci_address: g for g in self.available_gpus}
+        # IOMMU state and group layout only change across reboots
+        self._iommu_enabled: bool | None = None
+        self._iommu_groups: dict[str, IOMMUGroup] | None = None
+        self._disk_info_cache: dict[Path, tuple[bool, int]] = {}  # path -> (exists, size)
+        self._network_options: list[tuple[str, str]] | None = None  # Filled on first network edit
+
+        # Rendering state: rows are only rewritten when their content changes
+        self._dirty = True
+        self._full_redraw = True  # Set after dialogs draw over the screen
+        self._drawn_size = (0, 0)
+        self._drawn_rows: dict[int, str] = {}  # y -> last line written there
+        self._changes_count = 0
+        self._changes_footer = ""  # Styled "N change(s) pending" line for _changes_count
 
         # Build fields
         self.fields: list[DetailField] = []
         self._build_fields()
 
         # Find first editable field
-        for i, f in enumerate(self.fields):
-            if f.editable:
-                self.selected_index = i
-                break
+        if self._editable_indices:
+            self.selected_index = self._editable_indices[0]
 
     def _build_fields(self) -> None:
         """Build the detail fields from VM data."""
@@ -99,9 +125,9 @@ class VMDetailScreen:
         if self.vm.disks:
             disk_info = []
             for disk in self.vm.disks:
-                if disk.exists():
-                    size = format_bytes(disk.stat().st_size)
-                    disk_info.append(f"{disk.name} ({size})")
+                exists, size_bytes = self._disk_info(disk)
+                if exists:
+                    disk_info.append(f"{disk.name} ({format_bytes(size_bytes)})")
                 else:
                     disk_info.append(f"{disk.name} (missing)")
             self.fields.append(DetailField(
@@ -139,19 +165,9 @@ class VMDetailScreen:
         ))
 
         # GPU Passthrough (editable)
-        if self.selected_gpus:
-            gpu_names = []
-            for addr in self.selected_gpus:
-                gpu = next((g for g in self.available_gpus if g.pci_address == addr), None)
-                if gpu:
-                    gpu_names.append(gpu.display_name)
-                else:
-                    gpu_names.append(addr)
-            gpu_display = ", ".join(gpu_names)
-        else:
-            gpu_display = "None"
         self.fields.append(DetailField(
-            "gpu", "GPU Passthrough", gpu_display, editable=True, field_type="multi"
+            "gpu", "GPU Passthrough", self._format_gpu_display(self.selected_gpus),
+            editable=True, field_type="multi"
         ))
 
         # Audio (editable)
@@ -173,63 +189,117 @@ class VMDetailScreen:
             "persistent", "Persistent", "Yes" if self.vm.persistent else "No", editable=False
         ))
 
+        # Positions of editable fields, for navigation
+        self._editable_indices = [i for i, f in enumerate(self.fields) if f.editable]
+        self._editable_pos = {idx: pos for pos, idx in enumerate(self._editable_indices)}
+
+        # Style labels and read-only values once; per frame only selection changes
+        self._label_width = max(len(f.label) for f in self.fields) + 2
+        self._styled_labels = [self._style_label(f) for f in self.fields]
+        self._dim_values = {i: self.theme.dim(f.value) for i, f in enumerate(self.fields) if not f.editable}
+
+    def _style_label(self, field: DetailField) -> tuple[str, str]:
+        """Return the padded (normal, selected) label for a field."""
+        plain = field.label + ":"
+        if not field.editable:
+            dim = self.theme.dim(plain).ljust(self._label_width)
+            return dim, dim
+        return (
+            plain.ljust(self._label_width),
+            self.theme.colored(plain, "cyan").ljust(self._label_width),
+        )
+
+    def _format_gpu_display(self, addrs: list[str]) -> str:
+        """Format selected GPU addresses for display, using names where known."""
+        if not addrs:
+            return "None"
+        return ", ".join([
+            gpu.display_name if (gpu := self._gpu_by_addr.get(addr)) else addr
+            for addr in addrs
+        ])
+
+    def _disk_info(self, disk: Path) -> tuple[bool, int]:
+        """Return (exists, size) for a disk image, stat'ing it once per screen."""
+        info = self._disk_info_cache.get(disk)
+        if info is None:
+            try:
+                info = (True, disk.stat().st_size)
+            except OSError:
+                info = (False, 0)
+            self._disk_info_cache[disk] = info
+        return info
+
     def run(self) -> dict[str, Any] | None:
         """Run the detail screen. Returns changes dict or None."""
-        with self.term.cbreak(), self.term.hidden_cursor():
-            while True:
-                self._render()
-                key: Keystroke = self.term.inkey(timeout=0.1)
-                if not key:
-                    continue
-
-                result = self._handle_key(key)
-                if result == "cancel":
-                    return None
-                elif result == "save":
-                    return self._get_changes()
-
-    def _render(self) -> None:
-        """Render the detail screen."""
-        print(self.term.home + self.term.clear, end="")
+        # Select retries after signals, so a resize would not wake inkey(); flag
+        # it and chain to the app's handler so its own size check still runs
+        prev_resize = signal.getsignal(signal.SIGWINCH)
+
+        def handle_resize(signum: int, frame: Any) -> None:
+            self._dirty = True
+            if callable(prev_resize):
+                prev_resize(signum, frame)
+
+        signal.signal(signal.SIGWINCH, handle_resize)
+        try:
+            with self.term.cbreak(), self.term.hidden_cursor():
+                while True:
+                    # One terminal size query per iteration, shared with _render
+                    size = (self.term.width, self.term.height)
+                    if self._dirty or size != self._drawn_size:
+                        self._render(size)
+                        self._dirty = False
+                    # Nothing on this screen animates; wake only to pick up a resize
+                    key: Keystroke = self.term.inkey(timeout=self.RESIZE_POLL)
+                    if not key:
+                        continue
+
+                    result = self._handle_key(key)
+                    if result == "cancel":
+                        return None
+                    elif result == "save":
+                        return self._get_changes()
+                    self._dirty = True
+        finally:
+            if prev_resize is not None:
+                signal.signal(signal.SIGWINCH, prev_resize)
+
+    def _render(self, size: tuple[int, int]) -> None:
+        """Render the detail screen at the given (width, height), repainting only rows that changed."""
+        move_xy = self.term.move_xy
+        reverse = self.term.reverse
+        clear_eol = self.term.clear_eol
+        out: list[str] = []
+
+        width, height = size
+        if self._full_redraw or size != self._drawn_size:
+            out.append(self.term.home + self.term.clear)
+            self._drawn_rows = {}
+            self._drawn_size = size
+            self._full_redraw = False
+
+        rows: dict[int, str] = {}
 
         # Header
         title = f" Edit: {self.vm.name} "
-        print(
-            self.term.move_xy(0, 0)
-            + self.term.black_on_cyan(title.center(self.term.width)),
-            end="",
-        )
+        rows[0] = move_xy(0, 0) + self.term.black_on_cyan(title.center(width))
 
         # Fields
         y = 2
-        label_width = max(len(f.label) for f in self.fields) + 2
 
         for i, field in enumerate(self.fields):
             is_selected = not self.button_focused and i == self.selected_index
-
-            # Label
-            if field.editable:
-                if is_selected:
-                    label = self.theme.colored(field.label + ":", "cyan")
-                else:
-                    label = field.label + ":"
-            else:
-                label = self.theme.dim(field.label + ":")
+            label = self._styled_labels[i][is_selected]
 
             # Value
             if is_selected:
-                value = self.term.reverse(f" {field.value} ")
+                value = reverse(f" {field.value} ")
             elif not field.editable:
-                value = self.theme.dim(field.value)
+                value = self._dim_values[i]
             else:
                 value = field.value
 
-            print(
-                self.term.move_xy(2, y)
-                + label.ljust(label_width)
-                + value,
-                end="",
-            )
+            rows[y] = move_xy(2, y) + label + value
             y += 1
 
             # Add spacing after groups
@@ -242,44 +312,50 @@ class VMDetailScreen:
         save_btn = " Save "
 
         if self.button_focused and self.selected_button == 0:
-            cancel_btn = self.term.reverse(cancel_btn)
+            cancel_btn = reverse(cancel_btn)
         else:
             cancel_btn = f"[{cancel_btn.strip()}]"
 
         if self.button_focused and self.selected_button == 1:
-            save_btn = self.term.reverse(save_btn)
+            save_btn = reverse(save_btn)
         else:
             save_btn = f"[{save_btn.strip()}]"
 
-        print(
-            self.term.move_xy(2, y)
-            + cancel_btn + "  " + save_btn,
-            end="",
-        )
+        rows[y] = move_xy(2, y) + cancel_btn + "  " + save_btn
 
         # Footer hints
         hints = "↑/↓/Tab: Navigate  Enter: Select/Edit  Esc: Cancel"
-        print(
-            self.term.move_xy(0, self.term.height - 2)
-            + self.theme.dim(hints[:self.term.width]),
-            end="",
+        rows[height - 2] = (
+            move_xy(0, height - 2)
+            + self.theme.dim(hints[:width])
         )
 
-        # Show changes summary if any
-        if self.changes:
-            changes_text = f"{len(self.changes)} change(s) pending"
-            print(
-                self.term.move_xy(0, self.term.height - 1)
-                + self.theme.warning(changes_text),
-                end="",
-            )
-
-        print("", end="", flush=True)
+        # Show changes summary if any (restyled only when the count changes)
+        count = len(self.changes)
+        if count != self._changes_count:
+            self._changes_count = count
+            self._changes_footer = self.theme.warning(f"{count} change(s) pending") if count else ""
+        if self._changes_footer:
+            rows[height - 1] = move_xy(0, height - 1) + self._changes_footer
+
+        # Only rewrite rows whose content differs from what is on screen
+        for row, line in rows.items():
+            if self._drawn_rows.get(row) != line:
+                out.append(line + clear_eol)
+        for row in self._drawn_rows.keys() - rows.keys():
+            out.append(move_xy(0, row) + clear_eol)
+        self._drawn_rows = rows
+
+        # One write per frame
+        sys.stdout.write("".join(out))
+        sys.stdout.flush()
 
     def _handle_key(self, key: Keystroke) -> str | None:
         """Handle key input."""
+        name = key.name
+
         # Escape to cancel
-        if key.name == "KEY_ESCAPE":
+        if name == "KEY_ESCAPE":
             if self.changes:
                 # Confirm discard changes
                 from vm_manager.ui.widgets.dialog import ConfirmDialog
@@ -290,20 +366,18 @@ class VMDetailScreen:
                 )
                 if dialog.show():
                     return "cancel"
+                self._full_redraw = True
             else:
                 return "cancel"
             return None
 
         # Navigation
-        if key.name == "KEY_UP":
+        if name == "KEY_UP":
             if self.button_focused:
                 # Move from buttons to last editable field
                 self.button_focused = False
-                # Find last editable field
-                for i in range(len(self.fields) - 1, -1, -1):
-                    if self.fields[i].editable:
-                        self.selected_index = i
-                        break
+                if self._editable_indices:
+                    self.selected_index = self._editable_indices[-1]
             else:
                 moved = self._move_selection(-1)
                 if not moved:
@@ -311,14 +385,12 @@ class VMDetailScreen:
                     self.button_focused = True
                     self.selected_button = 0  # Default to Cancel
 
-        elif key.name == "KEY_DOWN" or key.name == "KEY_TAB":
+        elif name in ("KEY_DOWN", "KEY_TAB"):
             if self.button_focused:
                 # Move from buttons to first editable field
                 self.button_focused = False
-                for i, f in enumerate(self.fields):
-                    if f.editable:
-                        self.selected_index = i
-                        break
+                if self._editable_indices:
+                    self.selected_index = self._editable_indices[0]
             else:
                 # Try to move to next editable field
                 moved = self._move_selection(1)
@@ -327,13 +399,13 @@ class VMDetailScreen:
                     self.button_focused = True
                     self.selected_button = 1  # Default to Save
 
-        elif key.name == "KEY_LEFT" and self.button_focused:
+        elif name == "KEY_LEFT" and self.button_focused:
             self.selected_button = 0
 
-        elif key.name == "KEY_RIGHT" and self.button_focused:
+        elif name == "KEY_RIGHT" and self.button_focused:
             self.selected_button = 1
 
-        elif key.name == "KEY_ENTER":
+        elif name == "KEY_ENTER":
             if self.button_focused:
                 if self.selected_button == 0:
                     return "cancel"
@@ -342,32 +414,40 @@ class VMDetailScreen:
             else:
                 field = self.fields[self.selected_index]
                 if field.editable:
-                    self._edit_field(field)
+                    with self._batch():
+                        self._edit_field(field)
+                    self._full_redraw = True
 
         return None
 
+    @contextmanager
+    def _batch(self) -> Iterator[None]:
+        """Group change updates so the screen is marked dirty once at the end."""
+        self._batch_depth += 1
+        try:
+            yield
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0:
+                self._dirty = True
+
+    def _set_change(self, key: str, value: Any) -> None:
+        """Record a pending change; every edit goes through here."""
+        self.changes[key] = value
+        if self._batch_depth == 0:
+            self._dirty = True
+
     def _move_selection(self, direction: int) -> bool:
         """Move selection to next/prev editable field. Returns True if moved."""
-        start = self.selected_index
-        idx = start
-
-        while True:
-            new_idx = idx + direction
-
-            # Check bounds
-            if new_idx < 0 or new_idx >= len(self.fields):
-                return False  # Can't move further
+        pos = self._editable_pos.get(self.selected_index)
+        if pos is None:
+            return False
 
-            idx = new_idx
-            if self.fields[idx].editable:
-                self.selected_index = idx
-                return True
-
-            # Prevent infinite loop
-            if idx == start:
-                return False
-
-        return False
+        new_pos = pos + direction
+        if 0 <= new_pos < len(self._editable_indices):
+            self.selected_index = self._editable_indices[new_pos]
+            return True
+        return False  # Can't move further
 
     def _edit_field(self, field: DetailField) -> None:
         """Open editor for a field."""
@@ -383,7 +463,7 @@ class VMDetailScreen:
             result = dialog.show()
             if result:
                 field.value = result
-                self.changes["vcpus"] = int(result)
+                self._set_change("vcpus", int(result))
 
         elif field.name == "memory":
             max_mem = self.resources.memory_mb
@@ -398,18 +478,23 @@ class VMDetailScreen:
             result = dialog.show()
             if result:
                 field.value = f"{result} MB"
-                self.changes["memory"] = int(result)
+                self._set_change("memory", int(result))
 
         elif field.name == "network":
-            # Get available networks
-            options: list[tuple[str, str]] = []
-            for bridge in self.network_service.list_bridges():
-                options.append((f"bridge:{bridge}", f"{bridge} (bridge)"))
-            try:
-                for net in self.libvirt.list_networks():
-                    options.append((f"network:{net}", f"{net} (libvirt)"))
-            except Exception:
-                pass
+            # Get available networks (enumerated once per screen)
+            if self._network_options is None:
+                options: list[tuple[str, str]] = [
+                    (f"bridge:{bridge}", f"{bridge} (bridge)")
+                    for bridge in self.network_service.list_bridges()
+                ]
+                try:
+                    options.extend(
+                        (f"network:{net}", f"{net} (libvirt)") for net in self.libvirt.list_networks()
+                    )
+                except Exception:
+                    pass
+                self._network_options = options
+            options = self._network_options
 
             if options:
                 dialog = SearchSelect(
@@ -421,84 +506,62 @@ class VMDetailScreen:
                 if result:
                     display = result.split(":", 1)[1]
                     field.value = display
-                    self.changes["network"] = result
+                    self._set_change("network", result)
 
         elif field.name == "nic_model":
-            options = [
-                ("virtio", "VirtIO (Best performance)"),
-                ("e1000e", "Intel e1000e (Good compatibility)"),
-                ("e1000", "Intel e1000 (Legacy)"),
-                ("rtl8139", "Realtek RTL8139 (Wide compatibility)"),
-                ("vmxnet3", "VMware vmxnet3"),
-            ]
             dialog = SearchSelect(
                 self.term, self.theme,
                 "Select NIC Model",
-                options
+                NIC_MODEL_OPTIONS
             )
             result = dialog.show()
             if result:
                 field.value = result
-                self.changes["nic_model"] = result
+                self._set_change("nic_model", result)
 
         elif field.name == "graphics":
-            options = [
-                ("spice", "SPICE - Remote desktop (recommended)"),
-                ("vnc", "VNC - Basic remote viewer"),
-                ("none", "None - Serial console only"),
-            ]
             dialog = SearchSelect(
                 self.term, self.theme,
                 "Select Display Type",
-                options
+                GRAPHICS_OPTIONS
             )
             result = dialog.show()
             if result:
                 field.value = result.upper()
-                self.changes["graphics"] = result
+                self._set_change("graphics", result)
 
         elif field.name == "gpu":
             self._edit_gpu(field)
 
         elif field.name == "audio":
-            options = [
-                ("ich9", "Intel ICH9 (Recommended)"),
-                ("ich6", "Intel ICH6"),
-                ("ac97", "AC97 (Legacy)"),
-                ("none", "None"),
-            ]
             dialog = SearchSelect(
                 self.term, self.theme,
                 "Select Audio Device",
-                options
+                AUDIO_OPTIONS
             )
             result = dialog.show()
             if result:
                 field.value = result.upper()
-                self.changes["audio"] = result
+                self._set_change("audio", result)
 
         elif field.name == "autostart":
-            options = [
-                ("yes", "Yes - Start on host boot"),
-                ("no", "No"),
-            ]
             dialog = SearchSelect(
                 self.term, self.theme,
                 "Autostart on Boot",
-                options
+                AUTOSTART_OPTIONS
             )
             result = dialog.show()
             if result:
                 field.value = "Yes" if result == "yes" else "No"
-                self.changes["autostart"] = result == "yes"
+                self._set_change("autostart", result == "yes")
 
     def _edit_gpu(self, field: DetailField) -> None:
         """Edit GPU passthrough selection."""
         from vm_manager.ui.widgets.dialog import ToggleListDialog
 
-        self.available_gpus = self.gpu_service.list_gpus()
-
-        if not self.gpu_service.check_iommu_enabled():
+        if self._iommu_enabled is None:
+            self._iommu_enabled = self.gpu_service.check_iommu_enabled()
+        if not self._iommu_enabled:
             if self.available_gpus:
                 MessageDialog(
                     self.term, self.theme,
@@ -517,10 +580,14 @@ class VMDetailScreen:
             ).show()
             return
 
+        if self._iommu_groups is None:
+            self._iommu_groups = self.gpu_service.get_all_iommu_groups()
+        iommu_map = self._iommu_groups
+
         # Create options list with disabled flag for non-vfio GPUs
         gpu_options: list[tuple[str, str, bool]] = []
         for gpu in self.available_gpus:
-            group = self.gpu_service.get_iommu_group(gpu.pci_address)
+            group = iommu_map.get(gpu.pci_address)
             if group and len(group.devices) > 1:
                 device_types = [d.device_type for d in group.devices]
                 type_summary = ", ".join(sorted(set(device_types)))
@@ -548,33 +615,31 @@ class VMDetailScreen:
         )
 
         result = dialog.show()
+        if result is None:
+            return
 
         # Process selections - add entire IOMMU groups
         new_selected: list[str] = []
+        seen: set[str] = set()
         for addr in result:
-            group = self.gpu_service.get_iommu_group(addr)
+            group = iommu_map.get(addr)
             group_addrs = group.pci_addresses if group else [addr]
             for group_addr in group_addrs:
-                if group_addr not in new_selected:
+                if group_addr not in seen:
+                    seen.add(group_addr)
                     new_selected.append(group_addr)
 
         self.selected_gpus = new_selected
 
         # Update field display
-        if self.selected_gpus:
-            gpu_names = []
-            for addr in self.selected_gpus:
-                gpu = next((g for g in self.available_gpus if g.pci_address == addr), None)
-                if gpu:
-                    gpu_names.append(gpu.display_name)
-                else:
-                    gpu_names.append(addr)
-            field.value = ", ".join(gpu_names)
-        else:
-            field.value = "None"
+        field.value = self._format_gpu_display(self.selected_gpus)
 
-        self.changes["gpu_devices"] = self.selected_gpus.copy()
+        self._set_change("gpu_devices", self.selected_gpus.copy())
 
     def _get_changes(self) -> dict[str, Any]:
-        """Get all changes."""
-        return self.changes.copy()
+        """Get all changes.
+
+        Only called as run() returns, after which the screen is discarded, so
+        the dict is handed to the caller instead of being copied.
+        """
+        return self.changes
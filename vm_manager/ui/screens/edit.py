@@ -1,22 +1,68 @@
 """Edit VM wizard screen."""
 
+import signal
+import sys
+import time
+from collections.abc import Callable
 from typing import Any
 
 from blessed import Terminal
 from blessed.keyboard import Keystroke
 
-from vm_manager.config import DEFAULT_NETWORK
-from vm_manager.models import VM
+from vm_manager.config import (
+    AUDIO_OPTIONS,
+    AUTOSTART_OPTIONS,
+    DEFAULT_NETWORK,
+    GRAPHICS_OPTIONS,
+    NIC_MODEL_OPTIONS,
+)
+from vm_manager.models import VM, GPUDevice, IOMMUGroup
 from vm_manager.services import GPUService, LibvirtService, NetworkService, USBService
 from vm_manager.services.system import SystemService, SystemResources
 from vm_manager.ui.theme import Theme
+from vm_manager.ui.widgets.dialog import MessageDialog
 from vm_manager.ui.widgets.form import FieldType, Form, FormField
 from vm_manager.ui.widgets.search_select import SearchSelect
 
 
+def _disk_total_gb(vm: VM) -> int:
+    """Total size of the VM's disk images in GiB, one stat() per disk."""
+    total = 0
+    for disk in vm.disks:
+        try:
+            total += disk.stat().st_size
+        except OSError:
+            pass
+    return total >> 30
+
+
 class EditWizard:
     """Wizard for editing an existing VM."""
 
+    POLL_ACTIVE = 0.05  # inkey timeout (seconds) right after input
+    POLL_IDLE = 0.5  # inkey timeout once no key arrived for IDLE_AFTER seconds
+    IDLE_AFTER = 0.25
+    GPU_LIST_TTL = 2.0  # Seconds a GPU listing is reused across dialog opens
+
+    STEP_TITLES = (
+        "Basic Information",
+        "Resources",
+        "Network",
+        "Display & GPU",
+        "Audio",
+        "Settings",
+    )
+    RESTART_STEPS = frozenset({1, 2, 3, 4})  # Steps whose changes need a VM restart
+
+    # Single-choice selects handled by one code path: field name -> (step, dialog title)
+    SELECT_DIALOGS = {
+        "network": (2, "Select Network"),
+        "nic_model": (2, "Select NIC Model"),
+        "graphics": (3, "Select Display Type"),
+        "audio": (4, "Select Audio Device"),
+        "autostart": (5, "Autostart on Boot"),
+    }
+
     def __init__(
         self,
         term: Terminal,
@@ -39,43 +85,62 @@ class EditWizard:
 
         # Get system resources for limits
         self.resources: SystemResources = self.system_service.get_resources()
+        self._cpu_pinning_options = self._build_cpu_pinning_options()
 
         # Track changes
         self.changes: dict[str, Any] = {}
 
         # Track GPU selections (start with current VM's GPUs)
         self.selected_gpus: list[str] = list(vm.gpu_devices) if vm.gpu_devices else []
-        self.available_gpus = self.gpu_service.list_gpus()
-
-        # Build forms
-        self.forms: list[Form] = []
-        self._build_forms()
+        self._selected_gpu_set = set(self.selected_gpus)  # Mirrors selected_gpus for lookups
+        self.available_gpus: list[GPUDevice] = []  # Listed when the GPU step is first built
+        self._gpu_by_addr: dict[str, GPUDevice] = {}  # available_gpus indexed by PCI address
+        self._gpu_list_ts = float("-inf")  # monotonic time of the last list_gpus()
+        # IOMMU state and group layout only change across reboots; fetched on first GPU dialog
+        self._iommu_enabled: bool | None = None
+        self._iommu_groups: dict[str, IOMMUGroup] | None = None
+
+        # Rendering state
+        self._dirty = True  # Set when a key may have changed what is on screen
+        self._frame_cache: dict[tuple[int, int, int], tuple[str, str]] = {}  # (step, w, h) -> (header, footer)
+        self._full_redraw = True  # Set after dialogs draw over the screen
+        self._drawn_layout = (-1, 0, 0)  # (step, w, h) of the last full redraw
+        self._form_origin = (2, 3)
+
+        # Forms are built on first visit to their step (see _form)
+        self._form_factories: list[Callable[[], Form]] = [
+            self._make_step0_form,
+            self._make_step1_form,
+            self._make_step2_form,
+            self._make_step3_form,
+            self._make_step4_form,
+            self._make_step5_form,
+        ]
+        self.forms: list[Form | None] = [None] * len(self._form_factories)
 
-    def _build_forms(self) -> None:
-        """Build the edit forms with current VM values."""
+    def _build_cpu_pinning_options(self) -> list[tuple[str, str]]:
+        """Build the CPU pinning choices for the host CPU count."""
         max_cpus = self.resources.cpu_count
-        max_mem = self.resources.memory_mb
-        max_disk = self.resources.disk_free_gb
-
-        # Validators
-        def validate_cpus(val: str) -> str | None:
-            if not val or not val.isdigit():
-                return "Must be a number"
-            v = int(val)
-            if v < 1 or v > max_cpus:
-                return f"Must be 1-{max_cpus}"
-            return None
-
-        def validate_memory(val: str) -> str | None:
-            if not val or not val.isdigit():
-                return "Must be a number"
-            v = int(val)
-            if v < 256 or v > max_mem:
-                return f"Must be 256-{max_mem}"
-            return None
-
-        # Step 0: Basic Info (name is disabled)
-        self.forms.append(Form(
+        options: list[tuple[str, str]] = [("none", "None - No CPU pinning")]
+        if max_cpus >= 2:
+            options.append(("0-1", "CPUs 0-1 (first 2 cores)"))
+        if max_cpus >= 4:
+            options.append(("0-3", "CPUs 0-3 (first 4 cores)"))
+        if max_cpus >= 8:
+            options.append(("0-7", "CPUs 0-7 (first 8 cores)"))
+        return options
+
+    def _form(self, step: int) -> Form:
+        """Get the form for a step, building it on first access."""
+        form = self.forms[step]
+        if form is None:
+            form = self._form_factories[step]()
+            self.forms[step] = form
+        return form
+
+    def _make_step0_form(self) -> Form:
+        """Build the basic information form."""
+        return Form(
             self.term,
             self.theme,
             fields=[
@@ -88,10 +153,33 @@ class EditWizard:
                 ),
             ],
             buttons=[("cancel", "Cancel"), ("next", "Next")],
-        ))
+        )
+
+    def _make_step1_form(self) -> Form:
+        """Build the resources form."""
+        max_cpus = self.resources.cpu_count
+        max_mem = self.resources.memory_mb
 
-        # Step 1: Resources
-        self.forms.append(Form(
+        # Range messages are formatted once, not on every revalidating keystroke
+        cpu_range_error = f"Must be 1-{max_cpus}"
+        memory_range_error = f"Must be 256-{max_mem}"
+
+        # Validators (isascii keeps int() from taking its Unicode digit path)
+        def validate_cpus(val: str) -> str | None:
+            if not (val and val.isascii() and val.isdigit()):
+                return "Must be a number"
+            if not 1 <= int(val) <= max_cpus:
+                return cpu_range_error
+            return None
+
+        def validate_memory(val: str) -> str | None:
+            if not (val and val.isascii() and val.isdigit()):
+                return "Must be a number"
+            if not 256 <= int(val) <= max_mem:
+                return memory_range_error
+            return None
+
+        return Form(
             self.term,
             self.theme,
             fields=[
@@ -113,7 +201,7 @@ class EditWizard:
                     name="disk",
                     label="Disk GB:",
                     field_type=FieldType.NUMBER,
-                    value=str(sum(d.stat().st_size // (1024**3) for d in self.vm.disks if d.exists()) or "N/A"),
+                    value=str(_disk_total_gb(self.vm) or "N/A"),
                     disabled=True,  # Can't resize disk easily
                 ),
                 FormField(
@@ -125,10 +213,11 @@ class EditWizard:
                 ),
             ],
             buttons=[("cancel", "Cancel"), ("prev", "Previous"), ("next", "Next")],
-        ))
+        )
 
-        # Step 2: Network
-        self.forms.append(Form(
+    def _make_step2_form(self) -> Form:
+        """Build the network form."""
+        return Form(
             self.term,
             self.theme,
             fields=[
@@ -137,6 +226,7 @@ class EditWizard:
                     label="Network:",
                     field_type=FieldType.SELECT,
                     value=self.vm.networks[0] if self.vm.networks else DEFAULT_NETWORK,
+                    options=self._load_network_options(),
                     placeholder="Press Enter to select...",
                 ),
                 FormField(
@@ -144,33 +234,30 @@ class EditWizard:
                     label="NIC Model:",
                     field_type=FieldType.SELECT,
                     value="virtio",
-                    options=[
-                        ("virtio", "VirtIO (Best performance)"),
-                        ("e1000e", "Intel e1000e (Good compatibility)"),
-                        ("e1000", "Intel e1000 (Legacy)"),
-                        ("rtl8139", "Realtek RTL8139 (Wide compatibility)"),
-                        ("vmxnet3", "VMware vmxnet3"),
-                    ],
+                    options=NIC_MODEL_OPTIONS,
                     recommended=["virtio", "e1000e"],
                 ),
             ],
             buttons=[("cancel", "Cancel"), ("prev", "Previous"), ("next", "Next")],
-        ))
+        )
+
+    def _make_step3_form(self) -> Form:
+        """Build the display & GPU form."""
+        self._refresh_gpus()
 
-        # Step 3: Display & GPU
         # Get GPU display text
         gpu_display = "None"
         if self.selected_gpus:
             gpu_names = []
             for addr in self.selected_gpus:
-                gpu = next((g for g in self.available_gpus if g.pci_address == addr), None)
+                gpu = self._gpu_by_addr.get(addr)
                 if gpu:
                     gpu_names.append(gpu.display_name)
                 else:
                     gpu_names.append(addr)
             gpu_display = ", ".join(gpu_names) if gpu_names else f"{len(self.selected_gpus)} selected"
 
-        self.forms.append(Form(
+        return Form(
             self.term,
             self.theme,
             fields=[
@@ -186,19 +273,16 @@ class EditWizard:
                     label="Remote Access:",
                     field_type=FieldType.SELECT,
                     value=self.vm.graphics_type or "spice",
-                    options=[
-                        ("spice", "SPICE - Remote desktop (recommended)"),
-                        ("vnc", "VNC - Basic remote viewer"),
-                        ("none", "None - Serial console only"),
-                    ],
+                    options=GRAPHICS_OPTIONS,
                     recommended=["spice"],
                 ),
             ],
             buttons=[("cancel", "Cancel"), ("prev", "Previous"), ("next", "Next")],
-        ))
+        )
 
-        # Step 4: Audio
-        self.forms.append(Form(
+    def _make_step4_form(self) -> Form:
+        """Build the audio form."""
+        return Form(
             self.term,
             self.theme,
             fields=[
@@ -207,20 +291,16 @@ class EditWizard:
                     label="Audio Device:",
                     field_type=FieldType.SELECT,
                     value="ich9",
-                    options=[
-                        ("ich9", "Intel ICH9 (Recommended)"),
-                        ("ich6", "Intel ICH6"),
-                        ("ac97", "AC97 (Legacy)"),
-                        ("none", "None"),
-                    ],
+                    options=AUDIO_OPTIONS,
                     recommended=["ich9"],
                 ),
             ],
             buttons=[("cancel", "Cancel"), ("prev", "Previous"), ("next", "Next")],
-        ))
+        )
 
-        # Step 5: Settings
-        self.forms.append(Form(
+    def _make_step5_form(self) -> Form:
+        """Build the settings form."""
+        return Form(
             self.term,
             self.theme,
             fields=[
@@ -229,21 +309,23 @@ class EditWizard:
                     label="Autostart:",
                     field_type=FieldType.SELECT,
                     value="yes" if self.vm.autostart else "no",
-                    options=[
-                        ("yes", "Yes - Start on host boot"),
-                        ("no", "No"),
-                    ],
+                    options=AUTOSTART_OPTIONS,
                 ),
             ],
             buttons=[("cancel", "Cancel"), ("prev", "Previous"), ("save", "Save")],
-        ))
+        )
 
-        # Load network options
-        self._load_options()
+    def _refresh_gpus(self) -> None:
+        """Re-list host GPUs unless the last listing is under GPU_LIST_TTL old."""
+        now = time.monotonic()
+        if now - self._gpu_list_ts <= self.GPU_LIST_TTL:
+            return
+        self.available_gpus = self.gpu_service.list_gpus()
+        self._gpu_by_addr = {g.pci_address: g for g in self.available_gpus}
+        self._gpu_list_ts = now
 
-    def _load_options(self) -> None:
-        """Load available options for selects."""
-        # Networks
+    def _load_network_options(self) -> list[tuple[str, str]]:
+        """Load available networks for the network select."""
         network_options: list[tuple[str, str]] = []
         for bridge in self.network_service.list_bridges():
             network_options.append((f"bridge:{bridge}", f"{bridge} (bridge)"))
@@ -252,69 +334,102 @@ class EditWizard:
                 network_options.append((f"network:{net}", f"{net} (libvirt)"))
         except Exception:
             pass
-        if network_options:
-            self.forms[2].fields[0].options = network_options
+        return network_options
 
     def run(self) -> dict[str, Any] | None:
         """Run the wizard. Returns changes dict or None if cancelled."""
         self.step = 0
 
-        with self.term.cbreak(), self.term.hidden_cursor():
-            while True:
-                self._render()
-                key: Keystroke = self.term.inkey(timeout=0.1)
-                if not key:
-                    continue
+        # Repaint on resize even while idle; chain to the app's handler so its
+        # own size check still runs once the wizard returns
+        prev_resize = signal.getsignal(signal.SIGWINCH)
+
+        def handle_resize(signum: int, frame: Any) -> None:
+            self._dirty = True
+            if callable(prev_resize):
+                prev_resize(signum, frame)
 
-                result = self._handle_key(key)
-                if result == "cancel":
-                    return None
-                elif result == "save":
-                    return self._get_changes()
+        signal.signal(signal.SIGWINCH, handle_resize)
+        try:
+            with self.term.cbreak(), self.term.hidden_cursor():
+                last_key = time.monotonic()
+                while True:
+                    if self._dirty:
+                        self._render()
+                        self._dirty = False
+
+                    # Poll quickly while the user is typing, back off once idle
+                    idle = time.monotonic() - last_key > self.IDLE_AFTER
+                    key: Keystroke = self.term.inkey(timeout=self.POLL_IDLE if idle else self.POLL_ACTIVE)
+                    if not key:
+                        continue
+                    last_key = time.monotonic()
+
+                    # Apply every queued key (e.g. a held arrow) before repainting once
+                    while key:
+                        result = self._handle_key(key)
+                        if result == "cancel":
+                            return None
+                        elif result == "save":
+                            return self._get_changes()
+                        key = self.term.inkey(timeout=0)
+                    self._dirty = True
+        finally:
+            if prev_resize is not None:
+                signal.signal(signal.SIGWINCH, prev_resize)
 
     def _render(self) -> None:
         """Render the current step."""
-        print(self.term.home + self.term.clear, end="")
-
-        # Header
-        step_titles = [
-            "Basic Information",
-            "Resources",
-            "Network",
-            "Display & GPU",
-            "Audio",
-            "Settings",
-        ]
-        title = f" Edit VM - {step_titles[self.step]} ({self.step + 1}/{len(self.forms)}) "
-        print(
-            self.term.move_xy(0, 0)
-            + self.term.black_on_cyan(title.center(self.term.width)),
-            end="",
-        )
+        form = self._form(self.step)
+        # Each size read is an ioctl; take one snapshot per frame
+        width, height = self.term.width, self.term.height
+        layout = (self.step, width, height)
+
+        # Same step and size: header, hint and footer are unchanged, so only
+        # repaint the form rows that changed
+        if not self._full_redraw and layout == self._drawn_layout:
+            x, y = self._form_origin
+            form.render_dirty(x, y, width - 4)
+            sys.stdout.flush()
+            return
+
+        self._full_redraw = False
+        self._drawn_layout = layout
+
+        # Header and footer only depend on the step and terminal size
+        frame_key = layout
+        frame = self._frame_cache.get(frame_key)
+        if frame is None:
+            title = f" Edit VM - {self.STEP_TITLES[self.step]} ({self.step + 1}/{len(self.forms)}) "
+            hints = "Tab/↓: Next  Shift+Tab/↑: Previous  Enter: Select/Confirm"
+            frame = (
+                self.term.move_xy(0, 0) + self.term.black_on_cyan(title.center(width)),
+                self.term.move_xy(0, height - 1) + self.theme.dim(hints[:width]),
+            )
+            self._frame_cache[frame_key] = frame
+        header, footer = frame
+
+        # Clear, header and footer go out as one write; everything is
+        # cursor-addressed, so the footer can precede the form
+        buf = [self.term.home + self.term.clear, header, footer]
 
         # Hint about restart
-        if self.step in [1, 2, 3, 4]:  # Steps that require restart
+        if self.step in self.RESTART_STEPS:
             hint = self.theme.warning("Changes require VM restart to take effect")
-            print(self.term.move_xy(2, 2) + hint, end="")
+            buf.append(self.term.move_xy(2, 2) + hint)
             y = 4
         else:
             y = 3
+        sys.stdout.write("".join(buf))
 
         # Form
-        self.forms[self.step].render(2, y, self.term.width - 4)
-
-        # Footer
-        hints = "Tab/↓: Next  Shift+Tab/↑: Previous  Enter: Select/Confirm"
-        print(
-            self.term.move_xy(0, self.term.height - 1)
-            + self.theme.dim(hints[:self.term.width]),
-            end="",
-            flush=True,
-        )
+        self._form_origin = (2, y)
+        form.render(2, y, width - 4)
+        sys.stdout.flush()
 
     def _handle_key(self, key: Keystroke) -> str | None:
         """Handle key input."""
-        form = self.forms[self.step]
+        form = self._form(self.step)
         result = form.handle_key(key)
 
         if result is None:
@@ -324,6 +439,7 @@ class EditWizard:
         if result.startswith("select:"):
             field_name = result.split(":")[1]
             self._handle_select(field_name)
+            self._full_redraw = True
             return None
 
         # Handle buttons
@@ -342,107 +458,47 @@ class EditWizard:
 
     def _handle_select(self, field_name: str) -> None:
         """Handle select field interaction."""
-        if field_name == "network":
-            options = self.forms[2].fields[0].options
-            if options:
-                dialog = SearchSelect(
-                    self.term,
-                    self.theme,
-                    "Select Network",
-                    options,
-                )
-                result = dialog.show()
-                if result:
-                    display_name = result.split(":", 1)[1]
-                    self.forms[2].set_value("network", display_name)
-                    self.changes["network"] = result
-                    self.forms[2]._focus_next()
-
-        elif field_name == "graphics":
-            options = self.forms[3].fields[1].options
-            dialog = SearchSelect(
-                self.term,
-                self.theme,
-                "Select Display Type",
-                options,
-            )
-            result = dialog.show()
-            if result:
-                self.forms[3].set_value("graphics", result)
-                self.changes["graphics"] = result
-                self.forms[3]._focus_next()
-
-        elif field_name == "nic_model":
-            options = self.forms[2].fields[1].options
-            dialog = SearchSelect(
-                self.term,
-                self.theme,
-                "Select NIC Model",
-                options,
-            )
-            result = dialog.show()
-            if result:
-                self.forms[2].set_value("nic_model", result)
-                self.changes["nic_model"] = result
-                self.forms[2]._focus_next()
-
-        elif field_name == "audio":
-            options = self.forms[4].fields[0].options
-            dialog = SearchSelect(
-                self.term,
-                self.theme,
-                "Select Audio Device",
-                options,
-            )
-            result = dialog.show()
-            if result:
-                self.forms[4].set_value("audio", result)
-                self.changes["audio"] = result
-                self.forms[4]._focus_next()
-
-        elif field_name == "autostart":
-            options = self.forms[5].fields[0].options
-            dialog = SearchSelect(
-                self.term,
-                self.theme,
-                "Autostart on Boot",
-                options,
-            )
-            result = dialog.show()
+        select = self.SELECT_DIALOGS.get(field_name)
+        if select is not None:
+            step, title = select
+            form = self._form(step)
+            options = form.fields_by_name[field_name].options
+            if not options:
+                return
+            result = SearchSelect(self.term, self.theme, title, options).show()
             if result:
-                self.forms[5].set_value("autostart", result)
-                self.changes["autostart"] = result == "yes"
-                self.forms[5]._focus_next()
-
-        elif field_name == "cpu_pinning":
-            max_cpus = self.resources.cpu_count
-            options: list[tuple[str, str]] = [("none", "None - No CPU pinning")]
-            if max_cpus >= 2:
-                options.append(("0-1", "CPUs 0-1 (first 2 cores)"))
-            if max_cpus >= 4:
-                options.append(("0-3", "CPUs 0-3 (first 4 cores)"))
-            if max_cpus >= 8:
-                options.append(("0-7", "CPUs 0-7 (first 8 cores)"))
+                if field_name == "network":
+                    form.set_value(field_name, result.split(":", 1)[1])
+                    self.changes[field_name] = result
+                elif field_name == "autostart":
+                    form.set_value(field_name, result)
+                    self.changes[field_name] = result == "yes"
+                else:
+                    form.set_value(field_name, result)
+                    self.changes[field_name] = result
+                form._focus_next()
+            return
 
+        if field_name == "cpu_pinning":
             dialog = SearchSelect(
                 self.term,
                 self.theme,
                 "Select CPU Pinning",
-                options,
+                self._cpu_pinning_options,
             )
             result = dialog.show()
             if result:
-                self.forms[1].set_value("cpu_pinning", result)
+                self._form(1).set_value("cpu_pinning", result)
                 self.changes["cpu_pinning"] = result if result != "none" else ""
-                self.forms[1]._focus_next()
+                self._form(1)._focus_next()
 
         elif field_name == "gpu":
-            # Refresh GPU list
-            self.available_gpus = self.gpu_service.list_gpus()
+            self._refresh_gpus()
 
-            if not self.gpu_service.check_iommu_enabled():
+            if self._iommu_enabled is None:
+                self._iommu_enabled = self.gpu_service.check_iommu_enabled()
+            if not self._iommu_enabled:
                 if self.available_gpus:
-                    from vm_manager.ui.widgets.dialog import MessageDialog
                     MessageDialog(
                         self.term,
                         self.theme,
@@ -453,7 +509,6 @@ class EditWizard:
                 return
 
             if not self.available_gpus:
-                from vm_manager.ui.widgets.dialog import MessageDialog
                 MessageDialog(
                     self.term,
                     self.theme,
@@ -463,22 +518,28 @@ class EditWizard:
                 ).show()
                 return
 
-            # Create multi-select style list
-            gpu_options: list[tuple[str, str]] = []
-            for gpu in self.available_gpus:
-                # Mark if already selected
-                selected = gpu.pci_address in self.selected_gpus
-                prefix = "[X] " if selected else "[ ] "
+            # IOMMU groups don't change while the wizard is open
+            if self._iommu_groups is None:
+                self._iommu_groups = self.gpu_service.get_all_iommu_groups()
+            group_by_addr = self._iommu_groups
 
-                # Get IOMMU group info
-                group = self.gpu_service.get_iommu_group(gpu.pci_address)
+            # Build each GPU's label once; toggles only change the prefix
+            label_suffix_by_addr: dict[str, str] = {}
+            for gpu in self.available_gpus:
+                group = group_by_addr.get(gpu.pci_address)
                 if group and len(group.devices) > 1:
                     device_types = [d.device_type for d in group.devices]
                     type_summary = ", ".join(sorted(set(device_types)))
-                    label = f"{prefix}{gpu.display_name} (IOMMU: {type_summary})"
+                    label_suffix_by_addr[gpu.pci_address] = f"{gpu.display_name} (IOMMU: {type_summary})"
                 else:
-                    label = f"{prefix}{gpu.full_description}"
-                gpu_options.append((gpu.pci_address, label))
+                    label_suffix_by_addr[gpu.pci_address] = gpu.full_description
+
+            # Create multi-select style list
+            gpu_options: list[tuple[str, str]] = [
+                (addr, ("[X] " if addr in self._selected_gpu_set else "[ ] ") + suffix)
+                for addr, suffix in label_suffix_by_addr.items()
+            ]
+            addr_to_index = {addr: i for i, (addr, _) in enumerate(gpu_options)}
 
             dialog = SearchSelect(
                 self.term,
@@ -494,35 +555,32 @@ class EditWizard:
                     break
 
                 # Toggle selection - include entire IOMMU group
-                group = self.gpu_service.get_iommu_group(result)
+                group = group_by_addr.get(result)
                 group_addrs = group.pci_addresses if group else [result]
 
-                if result in self.selected_gpus:
+                if result in self._selected_gpu_set:
                     # Remove all devices in group
                     for addr in group_addrs:
-                        if addr in self.selected_gpus:
+                        if addr in self._selected_gpu_set:
+                            self._selected_gpu_set.discard(addr)
                             self.selected_gpus.remove(addr)
                 else:
                     # Add all devices in group
                     for addr in group_addrs:
-                        if addr not in self.selected_gpus:
+                        if addr not in self._selected_gpu_set:
+                            self._selected_gpu_set.add(addr)
                             self.selected_gpus.append(addr)
 
-                # Update display
-                for i, (val, display) in enumerate(gpu_options):
-                    selected = val in self.selected_gpus
-                    prefix = "[X] " if selected else "[ ] "
-                    gpu = next((g for g in self.available_gpus if g.pci_address == val), None)
-                    if gpu:
-                        group = self.gpu_service.get_iommu_group(gpu.pci_address)
-                        if group and len(group.devices) > 1:
-                            device_types = [d.device_type for d in group.devices]
-                            type_summary = ", ".join(sorted(set(device_types)))
-                            gpu_options[i] = (val, f"{prefix}{gpu.display_name} (IOMMU: {type_summary})")
-                        else:
-                            gpu_options[i] = (val, f"{prefix}{gpu.full_description}")
-                dialog.all_options = gpu_options
-                dialog.filtered_options = gpu_options.copy()
+                # Update display: only the toggled group's entries changed.
+                # dialog.all_options is gpu_options, so it sees the edits
+                for addr in group_addrs:
+                    i = addr_to_index.get(addr)
+                    if i is not None:
+                        prefix = "[X] " if addr in self._selected_gpu_set else "[ ] "
+                        gpu_options[i] = (addr, prefix + label_suffix_by_addr[addr])
+                # SearchSelect only ever rebinds filtered_options, so sharing
+                # the list is safe and skips a copy per toggle
+                dialog.filtered_options = gpu_options
                 # Reset search state for better UX
                 dialog.search_query = ""
                 dialog.selected_index = 0
@@ -532,7 +590,7 @@ class EditWizard:
             if self.selected_gpus:
                 gpu_names = []
                 for addr in self.selected_gpus:
-                    gpu = next((g for g in self.available_gpus if g.pci_address == addr), None)
+                    gpu = self._gpu_by_addr.get(addr)
                     if gpu:
                         gpu_names.append(gpu.display_name)
                     else:
@@ -540,28 +598,29 @@ class EditWizard:
                 display = ", ".join(gpu_names)
             else:
                 display = "None"
-            self.forms[3].set_value("gpu", display)
+            self._form(3).set_value("gpu", display)
             self.changes["gpu_devices"] = self.selected_gpus.copy()
-            self.forms[3]._focus_next()
+            self._form(3)._focus_next()
 
     def _get_changes(self) -> dict[str, Any]:
         """Get all changes from forms."""
         changes = self.changes.copy()
 
-        # Get values from forms
-        values = {}
-        for form in self.forms:
-            values.update(form.get_values())
-
-        # Check what changed
-        if int(values.get("vcpus", self.vm.vcpus)) != self.vm.vcpus:
-            changes["vcpus"] = int(values["vcpus"])
-
-        if int(values.get("memory", self.vm.memory_mb)) != self.vm.memory_mb:
-            changes["memory"] = int(values["memory"])
-
-        if "autostart" not in changes:
-            new_autostart = values.get("autostart", "no") == "yes"
+        # Only vcpus, memory and autostart are typed in; selects already record
+        # into self.changes. Steps never visited still hold the VM's current values
+        resources = self.forms[1]
+        if resources is not None:
+            fields = resources.fields_by_name
+            vcpus = int(fields["vcpus"].value)
+            if vcpus != self.vm.vcpus:
+                changes["vcpus"] = vcpus
+            memory = int(fields["memory"].value)
+            if memory != self.vm.memory_mb:
+                changes["memory"] = memory
+
+        settings = self.forms[5]
+        if "autostart" not in changes and settings is not None:
+            new_autostart = settings.fields_by_name["autostart"].value == "yes"
             if new_autostart != self.vm.autostart:
                 changes["autostart"] = new_autostart
 
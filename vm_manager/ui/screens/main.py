@@ -1,17 +1,54 @@
 """Main screen with VM list and details pane."""
 
+import os
+import sys
+import time
+from collections import OrderedDict
+from collections.abc import Iterable
+from functools import lru_cache
+from itertools import accumulate
 from pathlib import Path
 from typing import Any
 
 from blessed import Terminal
 
-from vm_manager.models import VM
+from vm_manager.config import AUDIO_OPTIONS, AUTOSTART_OPTIONS, GRAPHICS_OPTIONS, NIC_MODEL_OPTIONS
+from vm_manager.models import VM, GPUDevice, USBDevice
 from vm_manager.services import GPUService, LibvirtService, NetworkService, USBService
 from vm_manager.services.system import SystemService, SystemResources
 from vm_manager.ui.theme import Theme
 from vm_manager.ui.widgets.list_view import ListView
 from vm_manager.utils import format_bytes, format_duration
 
+# Labels of the fields built by MainScreen._build_vm_fields, in display order
+_FIELD_LABELS = (
+    "Name", "UUID", "State", "vCPUs", "Memory", "Disks", "ISO", "Network", "NIC Model",
+    "Display", "GPU Passthrough", "USB Passthrough", "Audio", "Autostart", "Boot Order",
+    "Snapshots", "Persistent",
+)
+_MAX_LABEL_WIDTH = max(len(label) for label in _FIELD_LABELS)
+# View-mode label column, already padded
+_VIEW_LABELS = {label: (label + ":").ljust(_MAX_LABEL_WIDTH + 1) for label in _FIELD_LABELS}
+
+# Synchronized output (DEC mode 2026): the terminal holds the frame and paints it at once
+_SYNC_BEGIN = "\x1b[?2026h"
+_SYNC_END = "\x1b[?2026l"
+_SYNC_TERMS = ("kitty", "wezterm", "foot", "alacritty", "ghostty", "contour")
+_SYNC_TERM_PROGRAMS = ("iTerm.app", "WezTerm", "ghostty")
+
+
+def _supports_synchronized_output() -> bool:
+    """Whether the terminal is known to honor synchronized output (mode 2026)."""
+    term = os.environ.get("TERM", "")
+    if any(name in term for name in _SYNC_TERMS):
+        return True
+    return os.environ.get("TERM_PROGRAM", "") in _SYNC_TERM_PROGRAMS
+
+
+def _trigrams(text: str) -> set[str]:
+    """Overlapping 3-character substrings of text."""
+    return {text[i : i + 3] for i in range(len(text) - 2)}
+
 
 class EditableField:
     """A field that can be edited inline."""
@@ -24,11 +61,13 @@ class EditableField:
         editable: bool = False,
         field_type: str = "text",  # text, select, multi
         edit_value: str | None = None,  # Raw value for editing (if different from display)
+        view_value: str | None = None,  # Styled value for view mode (if different from display)
     ):
         self.name = name
         self.label = label
         self.value = value  # Display value
         self.edit_value = edit_value if edit_value is not None else value  # Value used for editing
+        self.view_value = view_value if view_value is not None else value  # Value shown in view mode
         self.editable = editable
         self.field_type = field_type
 
@@ -36,6 +75,10 @@ class EditableField:
 class MainScreen:
     """Main application screen with split-pane layout."""
 
+    DISK_INFO_CACHE_SIZE = 256  # qemu-img results kept (LRU) across refreshes
+    CONSOLE_CACHE_TTL = 0.25  # Seconds a console output fetch is reused across renders
+    GROUP_END_FIELDS = frozenset({"state", "memory", "iso", "nic_model", "gpu", "autostart"})  # Blank line after
+
     def __init__(
         self,
         term: Terminal,
@@ -53,7 +96,17 @@ class MainScreen:
         self.usb_service = usb_service or USBService()
         self.system_service = system_service or SystemService()
         self.network_service = network_service or NetworkService()
+        # term.length() re-parses escape sequences on every call; the same
+        # styled lines and hints are measured every frame
+        self._visible_length = lru_cache(maxsize=4096)(term.length)
         self.vms: list[VM] = []
+        self._vm_names_lower: list[str] = []  # Parallel to self.vms, for search
+        self._trigram_index: dict[str, set[int]] = {}  # Name trigram -> indices into self.vms
+        # Last applied (lowercased) query and the indices into self.vms it matched;
+        # a query that extends it only needs to re-check those
+        self._search_last_query = ""
+        self._search_matches: list[int] = []
+        self.vms_generation = 0  # Bumped by set_vms; lets callers spot superseded listings
         self.vm_list: ListView[VM] = ListView(
             term=term,
             theme=theme,
@@ -66,6 +119,32 @@ class MainScreen:
         self.search_mode = False
         self.console_mode = False  # Toggle between info and console view
         self.console_buffer: list[str] = []  # Buffer for console output
+        # (vm name, max lines, width) -> (monotonic fetch time, truncated lines); one entry
+        self._console_cache: dict[tuple[str, int, int], tuple[float, list[str]]] = {}
+        self._last_render_state: tuple[Any, ...] | None = None  # See render()
+        self.dirty = True  # Set whenever something on screen may have changed; cleared by render()
+        self._sync_output = _supports_synchronized_output()
+        # Cursor-addressed segments keyed by (x, y): what is on screen (_front)
+        # and what the frame being drawn wants there (_back)
+        self._front: dict[tuple[int, int], str] = {}
+        self._back: dict[tuple[int, int], str] = {}
+        self._full_redraw = True  # Set when a dialog drew over the screen
+        # Borders and static titles only change with the layout; see _draw_chrome
+        self._layout_sig: tuple[int, int, int] | None = None  # (width, height, list_width)
+        self._chrome: dict[tuple[int, int], str] = {}
+        self._border_cache: dict[int, tuple[str, str, str]] = {}  # pane width -> (top, rule, bottom)
+        self._header_cache: tuple[tuple[int, int], str] | None = None  # ((width, VM count), header bar)
+        self._hints_cache: dict[tuple[Any, ...], str] = {}  # See _draw_hints
+        # (path, mtime_ns, size) -> qemu-img (actual, virtual) size; see _disk_info
+        self._disk_info_cache: OrderedDict[tuple[str, int, int], tuple[int, int] | None] = OrderedDict()
+        # View-mode fields per VM uuid, with the VM object they were built from.
+        # list_vms() returns fresh VM objects, so identity means unchanged data
+        self._fields_cache: dict[str, tuple[VM, list[EditableField]]] = {}
+        # VM list rows per uuid, with the (running, state, memory, name) they show
+        self._listitem_cache: dict[str, tuple[tuple[Any, ...], str]] = {}
+        self._ind_running = theme.colored("●", "green")
+        self._ind_paused = theme.colored("●", "yellow")
+        self._ind_stopped = theme.dim("○")
 
         # Edit mode state
         self.edit_mode = False
@@ -74,6 +153,10 @@ class MainScreen:
         self.edit_changes: dict[str, Any] = {}
         self.edit_vm: VM | None = None
         self.edit_button_focused = False  # True when focus is on Save/Cancel buttons
+        self._editable_indices: list[int] = []  # Indices of editable edit_fields
+        self._editable_pos: dict[int, int] = {}  # edit_fields index -> position in _editable_indices
+        # edit_fields index -> ((value, selected, changed), styled row); see _render_vm_fields
+        self._edit_lines: dict[int, tuple[tuple[Any, ...], str]] = {}
         self.edit_selected_button = 0  # 0 = Cancel, 1 = Save
 
         # System resources for validation
@@ -81,25 +164,66 @@ class MainScreen:
 
         # Track GPU selections for editing
         self.selected_gpus: list[str] = []
+        self.available_gpus: list[GPUDevice] = []
+        self._gpu_by_addr: dict[str, GPUDevice] = {}  # available_gpus indexed by PCI address
+        self._refresh_gpus()
+        self._usb_devices: list[USBDevice] | None = None  # Host USB devices, listed on demand
+        self._usb_by_id: dict[str, USBDevice] = {}  # _usb_devices indexed by id_string
+
+    def invalidate_device_caches(self) -> None:
+        """Forget cached host device lists so the next render re-queries them."""
+        self._usb_devices = None
+
+    def _refresh_gpus(self) -> None:
+        """Re-list host GPUs and index them by PCI address."""
         self.available_gpus = self.gpu_service.list_gpus()
+        self._gpu_by_addr = {g.pci_address: g for g in self.available_gpus}
+
+    def _store_usb(self, devices: list[USBDevice]) -> None:
+        """Remember a host USB listing and index it by id_string."""
+        self._usb_devices = devices
+        self._usb_by_id = {u.id_string: u for u in devices}
+
+    def _cached_usb(self) -> dict[str, USBDevice]:
+        """Get host USB devices by id_string, listing them once per refresh."""
+        if self._usb_devices is None:
+            self._store_usb(self.usb_service.list_devices())
+        return self._usb_by_id
 
     def refresh_vms(self) -> None:
         """Refresh the VM list from libvirt."""
         try:
-            self.vms = self.libvirt.list_vms()
-            if self.search_query:
-                filtered = [
-                    vm
-                    for vm in self.vms
-                    if self.search_query.lower() in vm.name.lower()
-                ]
-                self.vm_list.set_items(filtered)
-            else:
-                self.vm_list.set_items(self.vms)
+            vms = self.libvirt.list_vms()
         except Exception as e:
-            self.vms = []
-            self.vm_list.set_items([])
-            self.status_message = f"Error: {e}"
+            self.set_vms_error(e)
+            return
+        self.set_vms(vms)
+
+    def set_vms(self, vms: list[VM]) -> None:
+        """Show a freshly listed set of VMs (from refresh_vms or a background listing)."""
+        self.dirty = True
+        self.vms_generation += 1
+        self._fields_cache.clear()
+        self.invalidate_device_caches()
+        self.vms = vms
+        self._vm_names_lower = [vm.name.lower() for vm in vms]
+        self._build_search_index()
+        self._search_last_query = ""
+        # Drop rows of VMs that no longer exist
+        uuids = {vm.uuid for vm in self.vms}
+        for uuid in self._listitem_cache.keys() - uuids:
+            del self._listitem_cache[uuid]
+        self._apply_search()
+
+    def set_vms_error(self, error: Exception) -> None:
+        """Clear the VM list after listing failed."""
+        self.dirty = True
+        self.vms = []
+        self._vm_names_lower = []
+        self._trigram_index = {}
+        self._search_last_query = ""
+        self.vm_list.set_items([])
+        self.status_message = f"Error: {error}"
 
     def enter_edit_mode(self) -> bool:
         """Enter edit mode for the selected VM. Returns True if successful."""
@@ -107,6 +231,7 @@ class MainScreen:
         if not vm:
             return False
 
+        self.dirty = True
         self.edit_mode = True
         self.edit_vm = vm
         self.edit_changes = {}
@@ -115,15 +240,13 @@ class MainScreen:
         self.edit_selected_button = 0
         self.selected_gpus = list(vm.gpu_devices) if vm.gpu_devices else []
         self.selected_usb = list(vm.usb_devices) if vm.usb_devices else []
-        self.available_gpus = self.gpu_service.list_gpus()
+        self._refresh_gpus()
         self._build_edit_fields()
         self.console_mode = False  # Exit console mode if active
 
         # Find first editable field
-        for i, f in enumerate(self.edit_fields):
-            if f.editable:
-                self.edit_selected_index = i
-                break
+        if self._editable_indices:
+            self.edit_selected_index = self._editable_indices[0]
 
         return True
 
@@ -137,9 +260,12 @@ class MainScreen:
         else:
             changes = None
 
+        self.dirty = True
         self.edit_mode = False
         self.edit_vm = None
         self.edit_fields = []
+        self._editable_indices = []
+        self._editable_pos = {}
         self.edit_selected_index = 0
         self.edit_changes = {}
         self.edit_devices_to_steal = {}
@@ -160,10 +286,12 @@ class MainScreen:
 
         # State with uptime
         state_display = vm.state.display_name
+        state_view = self.theme.state_color(vm.state)
         if vm.is_running and vm.stats.uptime_seconds > 0:
-            uptime = format_duration(vm.stats.uptime_seconds)
-            state_display += f" (up {uptime})"
-        fields.append(EditableField("state", "State", state_display, editable=False))
+            uptime = f" (up {format_duration(vm.stats.uptime_seconds)})"
+            state_display += uptime
+            state_view += uptime
+        fields.append(EditableField("state", "State", state_display, editable=False, view_value=state_view))
 
         # Resources (editable)
         cpu_info = str(vm.vcpus)
@@ -186,20 +314,22 @@ class MainScreen:
         if vm.disks:
             disk_info = []
             for disk in vm.disks:
-                if disk.exists():
-                    # Get disk usage and max size from qcow2 info
-                    disk_sizes = self.libvirt.get_disk_info(disk)
-                    if disk_sizes:
-                        actual_size, virtual_size = disk_sizes
-                        used = format_bytes(actual_size)
-                        max_size = format_bytes(virtual_size)
-                        disk_info.append(f"{disk.name} ({used}/{max_size})")
-                    else:
-                        # Fallback to file size if qemu-img info fails
-                        size = format_bytes(disk.stat().st_size)
-                        disk_info.append(f"{disk.name} ({size})")
-                else:
+                try:
+                    st = disk.stat()
+                except OSError:
                     disk_info.append(f"{disk.name} (missing)")
+                    continue
+                # Get disk usage and max size from qcow2 info
+                disk_sizes = self._disk_info(disk, st)
+                if disk_sizes:
+                    actual_size, virtual_size = disk_sizes
+                    used = format_bytes(actual_size)
+                    max_size = format_bytes(virtual_size)
+                    disk_info.append(f"{disk.name} ({used}/{max_size})")
+                else:
+                    # Fallback to file size if qemu-img info fails
+                    size = format_bytes(st.st_size)
+                    disk_info.append(f"{disk.name} ({size})")
             disk_display = ", ".join(disk_info) if disk_info else "(none)"
         else:
             disk_display = "(none)"
@@ -236,7 +366,7 @@ class MainScreen:
         if gpu_list:
             gpu_names = []
             for addr in gpu_list:
-                gpu = next((g for g in self.available_gpus if g.pci_address == addr), None)
+                gpu = self._gpu_by_addr.get(addr)
                 if gpu:
                     gpu_names.append(gpu.display_name)
                 else:
@@ -249,11 +379,11 @@ class MainScreen:
         ))
 
         # USB Passthrough (editable)
-        available_usb = self.usb_service.list_devices()
+        usb_by_id = self._cached_usb()
         if vm.usb_devices:
             usb_names = []
             for usb_id in vm.usb_devices:
-                usb = next((u for u in available_usb if u.id_string == usb_id), None)
+                usb = usb_by_id.get(usb_id)
                 if usb:
                     usb_names.append(usb.display_name)
                 else:
@@ -274,7 +404,8 @@ class MainScreen:
         # Settings
         autostart_display = "Yes" if vm.autostart else "No"
         fields.append(EditableField(
-            "autostart", "Autostart", autostart_display, editable=True, field_type="select"
+            "autostart", "Autostart", autostart_display, editable=True, field_type="select",
+            view_value=self.theme.colored(autostart_display, "green" if vm.autostart else "red"),
         ))
 
         # Boot Order (always show, editable)
@@ -290,45 +421,119 @@ class MainScreen:
 
         persistent_display = "Yes" if vm.persistent else "No"
         fields.append(EditableField(
-            "persistent", "Persistent", persistent_display, editable=False
+            "persistent", "Persistent", persistent_display, editable=False,
+            view_value=self.theme.colored(persistent_display, "green" if vm.persistent else "red"),
         ))
 
         return fields
 
+    def _view_fields(self, vm: VM) -> list[EditableField]:
+        """Get view-mode fields for a VM, building them once per refresh."""
+        cached = self._fields_cache.get(vm.uuid)
+        if cached is not None and cached[0] is vm:
+            return cached[1]
+        fields = self._build_vm_fields(vm)
+        self._fields_cache[vm.uuid] = (vm, fields)
+        return fields
+
+    def _disk_info(self, disk: Path, st: os.stat_result) -> tuple[int, int] | None:
+        """Get a disk's (actual, virtual) size, re-running qemu-img only after the image changed."""
+        key = (str(disk), st.st_mtime_ns, st.st_size)
+        cache = self._disk_info_cache
+        if key in cache:
+            cache.move_to_end(key)
+            return cache[key]
+        info = self.libvirt.get_disk_info(disk)
+        cache[key] = info
+        if len(cache) > self.DISK_INFO_CACHE_SIZE:
+            cache.popitem(last=False)
+        return info
+
     def _build_edit_fields(self) -> None:
         """Build editable fields from the current VM."""
         if not self.edit_vm:
             return
         self.edit_fields = self._build_vm_fields(self.edit_vm)
+        self._edit_lines = {}
+
+        # Positions of editable fields, for navigation
+        self._editable_indices = [i for i, f in enumerate(self.edit_fields) if f.editable]
+        self._editable_pos = {idx: pos for pos, idx in enumerate(self._editable_indices)}
 
     def _format_vm_list_item(self, vm: VM) -> str:
         """Format a VM for the list view."""
+        state_name = vm.state.display_name
+        memory_display = vm.memory_display
+        key = (vm.is_running, state_name, memory_display, vm.name)
+        cached = self._listitem_cache.get(vm.uuid)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+
         # State indicator
         if vm.is_running:
-            indicator = self.theme.colored("●", "green")
-        elif vm.state.display_name == "paused":
-            indicator = self.theme.colored("●", "yellow")
+            indicator = self._ind_running
+        elif state_name == "paused":
+            indicator = self._ind_paused
         else:
-            indicator = self.theme.dim("○")
+            indicator = self._ind_stopped
 
         # Truncate name if needed
         name = vm.name[:20].ljust(20)
 
         # State and memory (both right-aligned)
-        state = vm.state.display_name[:10].rjust(10)
-        memory = vm.memory_display.rjust(6)
-
-        return f"{indicator} {name} {state} {memory}"
+        state = state_name[:10].rjust(10)
+        memory = memory_display.rjust(6)
+
+        text = f"{indicator} {name} {state} {memory}"
+        self._listitem_cache[vm.uuid] = (key, text)
+        return text
+
+    def _render_state(self) -> tuple[Any, ...]:
+        """Snapshot of everything the view-mode screen depends on."""
+        return (
+            self.term.width,
+            self.term.height,
+            len(self.vms),
+            tuple(self.vm_list.items),
+            self.vm_list.selected_index,
+            self.vm_list.scroll_offset,
+            self.status_message,
+            self.search_mode,
+            self.search_query,
+        )
 
-    def render(self) -> None:
-        """Render the entire screen."""
-        # Clear screen
-        print(self.term.home + self.term.clear, end="")
+    def render(self, force: bool = False) -> None:
+        """Render the entire screen.
+
+        Unless force is set, does nothing while the screen isn't dirty, and
+        skips the redraw when the view-mode state is unchanged since the last
+        render. Otherwise the frame is drawn into a shadow buffer and only
+        segments that differ from what is already on screen are written; force
+        (or a dialog having drawn over the screen) clears and repaints everything.
+        """
+        force = force or self._full_redraw
+        if not (force or self.dirty):
+            return
+        self.dirty = False
+        state = None
+        if not (force or self.edit_mode or self.console_mode):
+            state = self._render_state()
+            if state == self._last_render_state:
+                return
+        self._last_render_state = state
 
         # Calculate layout
-        list_width = min(45, self.term.width // 2)
-        details_width = self.term.width - list_width - 1
-        content_height = self.term.height - 6  # Account for header, hints, separator, and status
+        width, height = self.term.width, self.term.height
+        list_width = min(45, width // 2)
+        details_width = width - list_width - 1
+        content_height = height - 6  # Account for header, hints, separator, and status
+
+        # Start the frame from the static chrome, rebuilt only on resize
+        layout = (width, height, list_width)
+        if layout != self._layout_sig:
+            self._layout_sig = layout
+            self._chrome = self._draw_chrome(list_width, details_width, content_height)
+        self._back = self._chrome.copy()
 
         # Draw header and hints
         self._draw_header()
@@ -342,75 +547,97 @@ class MainScreen:
         # Draw status at bottom
         self._draw_status()
 
-        # Flush output
-        print("", end="", flush=True)
+        # Diff against the previous frame. A different set of segments means the
+        # layout changed (resize, list emptied), so start from a cleared screen
+        out: list[str] = []
+        front = self._front
+        if force or self._back.keys() != front.keys():
+            out.append(self.term.home + self.term.clear)
+            front = {}
+            self._full_redraw = False
+        for pos, segment in self._back.items():
+            if front.get(pos) != segment:
+                out.append(segment)
+        self._front = self._back
+        if not out:
+            return
+
+        # Let terminals that support it paint the whole frame atomically
+        if self._sync_output:
+            out.insert(0, _SYNC_BEGIN)
+            out.append(_SYNC_END)
+
+        sys.stdout.write("".join(out))
+        sys.stdout.flush()
 
     def _draw_header(self) -> None:
         """Draw the header bar."""
-        title = " VM Manager "
-        vm_count = f" {len(self.vms)} VMs "
-
-        # Center title
-        padding = self.term.width - len(title) - len(vm_count)
-        header = (
-            self.term.black_on_cyan(title)
-            + self.term.cyan("─" * padding)
-            + self.term.black_on_cyan(vm_count)
-        )
+        term = self.term
+        key = (term.width, len(self.vms))
+        if self._header_cache is None or self._header_cache[0] != key:
+            title = " VM Manager "
+            vm_count = f" {len(self.vms)} VMs "
+
+            # Center title
+            padding = term.width - len(title) - len(vm_count)
+            header = term.black_on_cyan(title) + term.cyan("─" * padding) + term.black_on_cyan(vm_count)
+            self._header_cache = (key, term.move_xy(0, 0) + header)
 
-        print(self.term.move_xy(0, 0) + header, end="")
+        self._back[(0, 0)] = self._header_cache[1]
 
         # Hints at line 1
         self._draw_hints()
 
-        # Separator line at line 2
-        separator = "─" * self.term.width
-        print(self.term.move_xy(0, 2) + self.theme.dim(separator), end="")
+    def _draw_chrome(self, list_width: int, details_width: int, height: int) -> dict[tuple[int, int], str]:
+        """Build the segments that only depend on the layout: separator, pane borders and list title."""
+        move_xy = self.term.move_xy
+        border = self.theme.header
+        chrome: dict[tuple[int, int], str] = {}
 
-    def _draw_vm_list(self, x: int, y: int, width: int, height: int) -> None:
-        """Draw the VM list pane."""
-        # Header
-        header = "VMs".center(width - 2)
-        print(
-            self.term.move_xy(x, y) + self.theme.header("┌" + "─" * (width - 2) + "┐"),
-            end="",
-        )
-        print(
-            self.term.move_xy(x, y + 1)
-            + self.theme.header("│")
-            + self.theme.bold(header)
-            + self.theme.header("│"),
-            end="",
-        )
-        print(
-            self.term.move_xy(x, y + 2) + self.theme.header("├" + "─" * (width - 2) + "┤"),
-            end="",
+        # Separator line at line 2
+        chrome[(0, 2)] = move_xy(0, 2) + self.theme.dim("─" * self.term.width)
+
+        # Both panes: top border, rule under the title row, bottom border
+        y = 3
+        for x, width in ((0, list_width), (list_width + 1, details_width)):
+            top, rule, bottom = self._borders(width)
+            chrome[(x, y)] = move_xy(x, y) + top
+            chrome[(x, y + 2)] = move_xy(x, y + 2) + rule
+            chrome[(x, y + height - 1)] = move_xy(x, y + height - 1) + bottom
+
+        # VM list title and side borders (the details pane title and sides are
+        # drawn with its content)
+        chrome[(0, y + 1)] = (
+            move_xy(0, y + 1) + border("│") + self.theme.bold("VMs".center(list_width - 2)) + border("│")
         )
+        for i in range(height - 4):
+            chrome[(0, y + 3 + i)] = move_xy(0, y + 3 + i) + border("│")
+            chrome[(list_width - 1, y + 3 + i)] = move_xy(list_width - 1, y + 3 + i) + border("│")
+
+        return chrome
+
+    def _borders(self, width: int) -> tuple[str, str, str]:
+        """Get the styled (top, rule, bottom) borders of a pane of the given width."""
+        borders = self._border_cache.get(width)
+        if borders is None:
+            line = "─" * (width - 2)
+            border = self.theme.header
+            borders = (border("┌" + line + "┐"), border("├" + line + "┤"), border("└" + line + "┘"))
+            self._border_cache[width] = borders
+        return borders
 
-        # VM list
+    def _draw_vm_list(self, x: int, y: int, width: int, height: int) -> None:
+        """Draw the VM list rows (borders come from _draw_chrome)."""
+        # VM list (ListView lines carry their own cursor position)
         list_height = height - 4
         self.vm_list.height = list_height
         lines = self.vm_list.render(x + 1, y + 3, width - 2)
-        for line in lines:
-            print(line, end="")
-
-        # Draw side borders for list area
-        for i in range(list_height):
-            print(self.term.move_xy(x, y + 3 + i) + self.theme.header("│"), end="")
-            print(
-                self.term.move_xy(x + width - 1, y + 3 + i) + self.theme.header("│"),
-                end="",
-            )
-
-        # Bottom border
-        print(
-            self.term.move_xy(x, y + height - 1)
-            + self.theme.header("└" + "─" * (width - 2) + "┘"),
-            end="",
-        )
+        back = self._back
+        for i, line in enumerate(lines, y + 3):
+            back[(x + 1, i)] = line
 
     def _draw_details_pane(self, x: int, y: int, width: int, height: int) -> None:
-        """Draw the VM details pane."""
+        """Draw the VM details pane title and content (borders come from _draw_chrome)."""
         vm = self.vm_list.selected_item
 
         # Header
@@ -422,20 +649,11 @@ class MainScreen:
             title = vm.name if vm else "No VM Selected"
         title = title[:width - 4].center(width - 2)
 
-        print(
-            self.term.move_xy(x, y) + self.theme.header("┌" + "─" * (width - 2) + "┐"),
-            end="",
-        )
-        print(
+        self._back[(x, y + 1)] = (
             self.term.move_xy(x, y + 1)
             + self.theme.header("│")
             + self.theme.bold(title)
-            + self.theme.header("│"),
-            end="",
-        )
-        print(
-            self.term.move_xy(x, y + 2) + self.theme.header("├" + "─" * (width - 2) + "┤"),
-            end="",
+            + self.theme.header("│")
         )
 
         # Details content
@@ -455,46 +673,48 @@ class MainScreen:
         else:
             details = [self.theme.dim("Select a VM to view details")]
 
+        # Hot loop: bind lookups and the styled border once
+        back = self._back
+        move_xy = self.term.move_xy
+        truncate = self._truncate_with_ansi
+        bar = self.theme.header("│")
+        blank = " " * (width - 2)
+        num_details = len(details)
         for i in range(content_height):
-            print(self.term.move_xy(x, content_start + i) + self.theme.header("│"), end="")
-            if i < len(details):
+            if i < num_details:
                 # Add left padding space, then truncate/pad properly handling ANSI codes
-                line = " " + self._truncate_with_ansi(details[i], content_width)
+                line = " " + truncate(details[i], content_width)
             else:
-                line = " " * (width - 2)
-            print(line, end="")
-            print(self.theme.header("│"), end="")
-
-        # Bottom border
-        print(
-            self.term.move_xy(x, y + height - 1)
-            + self.theme.header("└" + "─" * (width - 2) + "┘"),
-            end="",
-        )
+                line = blank
+            back[(x, content_start + i)] = move_xy(x, content_start + i) + bar + line + bar
 
     def _truncate_with_ansi(self, text: str, max_width: int) -> str:
         """Truncate text with ANSI codes to visible width and pad to exact width."""
-        visible_len = self.term.length(text)
+        visible_len = self._visible_length(text)
 
         if visible_len <= max_width:
             # Pad to exact width
             padding_needed = max_width - visible_len
             return text + " " * padding_needed
 
-        # Need to truncate - find approximate position
-        ratio = max_width / visible_len
-        truncate_pos = int(len(text) * ratio)
-
-        # Adjust position to get exact visible width
-        truncated = text[:truncate_pos]
-        while self.term.length(truncated) > max_width and truncate_pos > 0:
-            truncate_pos -= 1
-            truncated = text[:truncate_pos]
+        # Need to truncate - binary search for the longest prefix that fits. Cuts
+        # only fall between whole escape sequences/characters: a prefix ending
+        # mid-sequence can measure wider than a longer one
+        length = self._visible_length
+        ends = list(accumulate(len(piece) for piece in self.term.split_seqs(text)))
+        lo, hi = 0, len(ends) - 1
+        lo_len = 0
+        while lo < hi:
+            mid = (lo + hi + 1) // 2
+            mid_len = length(text[: ends[mid - 1]])
+            if mid_len <= max_width:
+                lo, lo_len = mid, mid_len
+            else:
+                hi = mid - 1
 
         # Pad to exact width
-        visible_len = self.term.length(truncated)
-        padding_needed = max_width - visible_len
-        return truncated + " " * padding_needed
+        cut = ends[lo - 1] if lo else 0
+        return text[:cut] + " " * (max_width - lo_len)
 
     def _render_vm_fields(self, vm: VM, width: int, edit_mode: bool = False) -> list[str]:
         """Parameterized method to render VM fields in view or edit mode."""
@@ -505,69 +725,44 @@ class MainScreen:
         if edit_mode and self.edit_fields:
             fields = self.edit_fields
         else:
-            fields = self._build_vm_fields(vm)
+            fields = self._view_fields(vm)
 
         if not fields:
             return [self.theme.dim("No fields available")]
 
-        # Calculate label width for consistent spacing
-        label_width = max(len(f.label) for f in fields)
+        # Labels are a fixed set, so the column width is a constant
+        label_width = _MAX_LABEL_WIDTH
+        view_labels = _VIEW_LABELS
 
-        # Render each field
+        # Render each field (hot loop: bind lookups once)
+        append = details.append
+        edit_lines = self._edit_lines
+        edit_changes = self.edit_changes
+        selected_index = -1 if self.edit_button_focused else self.edit_selected_index
+        group_ends = self.GROUP_END_FIELDS
         for i, field in enumerate(fields):
-            is_selected = edit_mode and not self.edit_button_focused and i == self.edit_selected_index
-            has_changes = edit_mode and field.name in self.edit_changes
-
-            # Add change marker to label if field has pending changes
-            if has_changes:
-                label_text = field.label + ": *"
-            else:
-                label_text = field.label + ":"
-
-            # Determine styling based on mode and field state
             if edit_mode:
-                # EDIT MODE styling
-                if is_selected and field.editable:
-                    # Highlight selected editable field
-                    value = self.term.reverse(f" {field.value} ")
-                    if has_changes:
-                        # Changed field that's selected - use warning color with cyan
-                        label = self.theme.warning(label_text.ljust(label_width + 2))
-                    else:
-                        label = self.theme.colored(label_text.ljust(label_width + 2), "cyan")
-                elif has_changes and field.editable:
-                    # Changed field (not selected) - highlight in warning color
-                    label = self.theme.warning(label_text.ljust(label_width + 2))
-                    value = self.theme.warning(field.value)
-                elif not field.editable:
-                    # Grey out non-editable fields
-                    label = self.theme.dim(label_text.ljust(label_width + 2))
-                    value = self.theme.dim(field.value)
+                is_selected = i == selected_index
+                has_changes = field.name in edit_changes
+
+                # Edit fields are mutated in place; restyle a row only when its
+                # value, selection or change marker differs from last frame
+                row_state = (field.value, is_selected, has_changes)
+                cached = edit_lines.get(i)
+                if cached is not None and cached[0] == row_state:
+                    line = cached[1]
                 else:
-                    # Normal editable field
-                    label = label_text.ljust(label_width + 2)
-                    value = field.value
+                    line = self._style_edit_row(field, is_selected, has_changes, label_width)
+                    edit_lines[i] = (row_state, line)
             else:
-                # VIEW MODE styling
-                label = label_text.ljust(label_width + 1)
-                value = field.value
-
-                # Apply color to special fields in view mode
-                if field.name == "state":
-                    value = self.theme.state_color(vm.state)
-                    if vm.is_running and vm.stats.uptime_seconds > 0:
-                        uptime = format_duration(vm.stats.uptime_seconds)
-                        value += f" (up {uptime})"
-                elif field.name == "autostart":
-                    value = self.theme.colored(value, "green") if vm.autostart else self.theme.colored(value, "red")
-                elif field.name == "persistent":
-                    value = self.theme.colored(value, "green") if vm.persistent else self.theme.colored(value, "red")
-
-            details.append(f"{label} {value}")
+                # VIEW MODE styling (state/autostart/persistent colors baked in at build time)
+                line = f"{view_labels[field.label]} {field.view_value}"
+
+            append(line)
 
             # Add spacing after groups
-            if field.name in ("state", "memory", "iso", "nic_model", "gpu", "autostart"):
-                details.append("")
+            if field.name in group_ends:
+                append("")
 
         # EDIT MODE: Add buttons with pending changes in Save label
         if edit_mode:
@@ -598,6 +793,36 @@ class MainScreen:
 
         return details
 
+    def _style_edit_row(self, field: EditableField, is_selected: bool, has_changes: bool, label_width: int) -> str:
+        """Style one field row in edit mode."""
+        # Add change marker to label if field has pending changes
+        if has_changes:
+            label_text = field.label + ": *"
+        else:
+            label_text = field.label + ":"
+
+        if is_selected and field.editable:
+            # Highlight selected editable field
+            value = self.term.reverse(f" {field.value} ")
+            if has_changes:
+                # Changed field that's selected - use warning color with cyan
+                label = self.theme.warning(label_text.ljust(label_width + 2))
+            else:
+                label = self.theme.colored(label_text.ljust(label_width + 2), "cyan")
+        elif has_changes and field.editable:
+            # Changed field (not selected) - highlight in warning color
+            label = self.theme.warning(label_text.ljust(label_width + 2))
+            value = self.theme.warning(field.value)
+        elif not field.editable:
+            # Grey out non-editable fields
+            label = self.theme.dim(label_text.ljust(label_width + 2))
+            value = self.theme.dim(field.value)
+        else:
+            # Normal editable field
+            label = label_text.ljust(label_width + 2)
+            value = field.value
+        return f"{label} {value}"
+
     def _get_vm_details(self, vm: VM, width: int) -> list[str]:
         """Get formatted VM details in view mode."""
         return self._render_vm_fields(vm, width, edit_mode=False)
@@ -617,15 +842,24 @@ class MainScreen:
         lines.append(self.theme.dim("─" * min(width, 30)))
         lines.append("")
 
-        # Try to get console output from libvirt
+        # Try to get console output from libvirt, reusing a fetch younger than
+        # CONSOLE_CACHE_TTL for the same VM and pane size
         try:
-            console_data = self.libvirt.get_console_output(vm.name, max_lines - 5)
-            if console_data:
-                for line in console_data:
-                    # Truncate long lines
-                    if len(line) > width:
-                        line = line[:width - 3] + "..."
-                    lines.append(line)
+            now = time.monotonic()
+            key = (vm.name, max_lines, width)
+            cached = self._console_cache.get(key)
+            if cached is not None and now - cached[0] < self.CONSOLE_CACHE_TTL:
+                console_lines = cached[1]
+            else:
+                console_data = self.libvirt.get_console_output(vm.name, max_lines - 5)
+                # Truncate long lines
+                console_lines = [
+                    line[:width - 3] + "..." if len(line) > width else line
+                    for line in console_data or ()
+                ]
+                self._console_cache = {key: (now, console_lines)}
+            if console_lines:
+                lines.extend(console_lines)
             else:
                 lines.append(self.theme.dim("No console output available"))
                 lines.append("")
@@ -641,6 +875,39 @@ class MainScreen:
 
     def _draw_hints(self) -> None:
         """Draw keyboard hints at line 1."""
+        # The key set only depends on the mode and the selected VM's capabilities
+        vm = self.vm_list.selected_item
+        key = (
+            self.edit_mode,
+            self.term.width,
+            vm is not None,
+            vm is not None and vm.can_start,
+            vm is not None and vm.can_stop,
+            vm is not None and vm.is_running,
+        )
+        hints_text = self._hints_cache.get(key)
+        if hints_text is None:
+            hints_text = self._build_hints(vm)
+            self._hints_cache[key] = hints_text
+
+        # Draw hints with search indicator if in search mode
+        if self.search_mode:
+            search_indicator = f"[Search: {self.search_query}█] "
+            combined = search_indicator + hints_text
+            visible_combined = self._visible_length(combined)
+            if visible_combined > self.term.width:
+                # Truncate hints to fit with search
+                available = self.term.width - self._visible_length(search_indicator) - 3
+                ratio = available / self._visible_length(hints_text)
+                truncate_at = int(len(hints_text) * ratio * 0.95)
+                hints_text = hints_text[:truncate_at] + "..."
+            hints_text = self.theme.warning(search_indicator) + hints_text
+
+        # Hints vary in length; clear the rest of the row when they change
+        self._back[(0, 1)] = self.term.move_xy(0, 1) + hints_text + self.term.clear_eol
+
+    def _build_hints(self, vm: VM | None) -> str:
+        """Build the keyboard hint bar for the current mode, truncated to the terminal width."""
         # Edit mode has different keybindings
         if self.edit_mode:
             keys: list[str] = [
@@ -652,8 +919,6 @@ class MainScreen:
             hints_text = "  ".join(keys)
         else:
             # Keybindings
-            vm = self.vm_list.selected_item
-
             keys: list[str] = []
             keys.append(self.theme.key_hint("n", "ew"))
             if vm:
@@ -675,42 +940,24 @@ class MainScreen:
             hints_text = "  ".join(keys)
 
         # Truncate if too long (calculate visible length, not including ANSI codes)
-        visible_len = self.term.length(hints_text)
+        visible_len = self._visible_length(hints_text)
         if visible_len > self.term.width:
             # Truncate to fit, accounting for "..."
             ratio = self.term.width / visible_len
             truncate_at = int(len(hints_text) * ratio * 0.95)  # 0.95 for safety margin
             hints_text = hints_text[:truncate_at] + "..."
 
-        # Draw hints with search indicator if in search mode
-        if self.search_mode:
-            search_indicator = f"[Search: {self.search_query}█] "
-            combined = search_indicator + hints_text
-            visible_combined = self.term.length(combined)
-            if visible_combined > self.term.width:
-                # Truncate hints to fit with search
-                available = self.term.width - self.term.length(search_indicator) - 3
-                ratio = available / self.term.length(hints_text)
-                truncate_at = int(len(hints_text) * ratio * 0.95)
-                hints_text = hints_text[:truncate_at] + "..."
-            print(self.term.move_xy(0, 1) + self.theme.warning(search_indicator) + hints_text, end="")
-        else:
-            print(self.term.move_xy(0, 1) + hints_text, end="")
+        return hints_text
 
     def _draw_status(self) -> None:
         """Draw status message at bottom."""
-        status_y = self.term.height - 1
-        if self.status_message:
-            print(
-                self.term.move_xy(0, status_y)
-                + self.status_message[: self.term.width],
-                end="",
-            )
-        else:
-            print(self.term.move_xy(0, status_y) + " " * self.term.width, end="")
+        term = self.term
+        status_y = term.height - 1
+        self._back[(0, status_y)] = term.move_xy(0, status_y) + self.status_message[: term.width] + term.clear_eol
 
     def set_status(self, message: str, message_type: str = "info") -> None:
         """Set status message."""
+        self.dirty = True
         if message_type == "error":
             self.status_message = self.theme.error(message)
         elif message_type == "success":
@@ -722,12 +969,15 @@ class MainScreen:
 
     def handle_key(self, key: str) -> str | None:
         """Handle key input. Returns action name or None."""
+        self.dirty = True
+
         # Edit mode handling
         if self.edit_mode:
             # Escape key - try multiple key names
             if key == "KEY_ESCAPE" or key == "\x1b" or (len(key) == 1 and ord(key) == 27):
                 # Confirm if there are changes
                 if self.edit_changes:
+                    self._full_redraw = True
                     from vm_manager.ui.widgets.dialog import ConfirmDialog
                     dialog = ConfirmDialog(
                         self.term, self.theme,
@@ -743,10 +993,8 @@ class MainScreen:
                 if self.edit_button_focused:
                     # Move from buttons to last editable field
                     self.edit_button_focused = False
-                    for i in range(len(self.edit_fields) - 1, -1, -1):
-                        if self.edit_fields[i].editable:
-                            self.edit_selected_index = i
-                            break
+                    if self._editable_indices:
+                        self.edit_selected_index = self._editable_indices[-1]
                 else:
                     # Try to move to previous field
                     if not self._move_edit_selection(-1):
@@ -758,10 +1006,8 @@ class MainScreen:
                 if self.edit_button_focused:
                     # Move from buttons to first editable field
                     self.edit_button_focused = False
-                    for i, f in enumerate(self.edit_fields):
-                        if f.editable:
-                            self.edit_selected_index = i
-                            break
+                    if self._editable_indices:
+                        self.edit_selected_index = self._editable_indices[0]
                 else:
                     # Try to move to next field
                     if not self._move_edit_selection(1):
@@ -780,6 +1026,7 @@ class MainScreen:
                     if self.edit_selected_button == 0:
                         # Cancel button
                         if self.edit_changes:
+                            self._full_redraw = True
                             from vm_manager.ui.widgets.dialog import ConfirmDialog
                             dialog = ConfirmDialog(
                                 self.term, self.theme,
@@ -798,6 +1045,7 @@ class MainScreen:
                     if self.edit_fields and 0 <= self.edit_selected_index < len(self.edit_fields):
                         field = self.edit_fields[self.edit_selected_index]
                         if field.editable:
+                            self._full_redraw = True  # Editors are dialogs
                             self._edit_field(field)
                 return None
             return None
@@ -822,6 +1070,7 @@ class MainScreen:
         if self.vm_list.handle_key(key):
             # Reset console mode when changing selection
             self.console_mode = False
+            self._console_cache.clear()
             return None
 
         # Actions
@@ -858,47 +1107,58 @@ class MainScreen:
             # Toggle console view
             if self.vm_list.selected_item.is_running:
                 self.console_mode = not self.console_mode
+                self._console_cache.clear()
             return None
         elif key == "KEY_ENTER" and self.vm_list.selected_item:
             return "details"
 
         return None
 
+    def _build_search_index(self) -> None:
+        """Index the lowercased VM names by trigram."""
+        index: dict[str, set[int]] = {}
+        for i, name in enumerate(self._vm_names_lower):
+            for gram in _trigrams(name):
+                index.setdefault(gram, set()).add(i)
+        self._trigram_index = index
+
     def _apply_search(self) -> None:
         """Apply search filter to VM list."""
         if self.search_query:
-            filtered = [
-                vm for vm in self.vms if self.search_query.lower() in vm.name.lower()
-            ]
-            self.vm_list.set_items(filtered)
+            query = self.search_query.lower()
+            names = self._vm_names_lower
+            last = self._search_last_query
+            # Typing narrows the previous matches; otherwise queries of 3+ chars
+            # start from the VMs sharing all their trigrams, shorter ones scan everything
+            if last and query.startswith(last):
+                candidates: Iterable[int] = self._search_matches
+            elif len(query) >= 3:
+                postings = sorted(
+                    (self._trigram_index.get(gram, set()) for gram in _trigrams(query)),
+                    key=len,
+                )
+                candidates = sorted(postings[0].intersection(*postings[1:]))
+            else:
+                candidates = range(len(names))
+            matches = [i for i in candidates if query in names[i]]
+            self._search_last_query = query
+            self._search_matches = matches
+            vms = self.vms
+            self.vm_list.set_items([vms[i] for i in matches])
         else:
             self.vm_list.set_items(self.vms)
 
     def _move_edit_selection(self, direction: int) -> bool:
         """Move selection to next/prev editable field in edit mode. Returns True if moved."""
-        if not self.edit_fields:
+        pos = self._editable_pos.get(self.edit_selected_index)
+        if pos is None:
             return False
 
-        start = self.edit_selected_index
-        idx = start
-
-        while True:
-            new_idx = idx + direction
-
-            # Check bounds
-            if new_idx < 0 or new_idx >= len(self.edit_fields):
-                return False  # Can't move further
-
-            idx = new_idx
-            if self.edit_fields[idx].editable:
-                self.edit_selected_index = idx
-                return True
-
-            # Prevent infinite loop
-            if idx == start:
-                return False
-
-        return False
+        new_pos = pos + direction
+        if 0 <= new_pos < len(self._editable_indices):
+            self.edit_selected_index = self._editable_indices[new_pos]
+            return True
+        return False  # Can't move further
 
     def _edit_field(self, field: EditableField) -> None:
         """Open editor for a field in inline edit mode."""
@@ -1032,13 +1292,7 @@ class MainScreen:
                     self.edit_changes.pop("iso", None)
 
         elif field.name == "nic_model":
-            options = [
-                ("virtio", "VirtIO (Best performance)"),
-                ("e1000e", "Intel e1000e (Good compatibility)"),
-                ("e1000", "Intel e1000 (Legacy)"),
-                ("rtl8139", "Realtek RTL8139 (Wide compatibility)"),
-                ("vmxnet3", "VMware vmxnet3"),
-            ]
+            options = NIC_MODEL_OPTIONS
             # Find current value index
             current_value = self.edit_vm.nic_model or "virtio"
             selected_idx = next((i for i, (val, _) in enumerate(options) if val == current_value), 0)
@@ -1060,11 +1314,7 @@ class MainScreen:
                     self.edit_changes.pop("nic_model", None)
 
         elif field.name == "graphics":
-            options = [
-                ("spice", "SPICE - Remote desktop (recommended)"),
-                ("vnc", "VNC - Basic remote viewer"),
-                ("none", "None - Serial console only"),
-            ]
+            options = GRAPHICS_OPTIONS
             # Find current value index
             current_value = self.edit_vm.graphics_type or "none"
             selected_idx = next((i for i, (val, _) in enumerate(options) if val == current_value), 0)
@@ -1092,12 +1342,7 @@ class MainScreen:
             self._edit_usb_field(field)
 
         elif field.name == "audio":
-            options = [
-                ("ich9", "Intel ICH9 (Recommended)"),
-                ("ich6", "Intel ICH6"),
-                ("ac97", "AC97 (Legacy)"),
-                ("none", "None"),
-            ]
+            options = AUDIO_OPTIONS
             # Find current value index
             current_value = self.edit_vm.audio_model or "none"
             selected_idx = next((i for i, (val, _) in enumerate(options) if val == current_value), 0)
@@ -1119,10 +1364,7 @@ class MainScreen:
                     self.edit_changes.pop("audio", None)
 
         elif field.name == "autostart":
-            options = [
-                ("yes", "Yes - Start on host boot"),
-                ("no", "No"),
-            ]
+            options = AUTOSTART_OPTIONS
             # Find current value index
             current_value = "yes" if self.edit_vm.autostart else "no"
             selected_idx = 0 if current_value == "yes" else 1
@@ -1194,7 +1436,7 @@ class MainScreen:
         debug_log = open('/tmp/vm_manager_gpu_debug.log', 'a')
 
         # Refresh GPU list
-        self.available_gpus = self.gpu_service.list_gpus()
+        self._refresh_gpus()
 
         # Check IOMMU
         if not self.gpu_service.check_iommu_enabled():
@@ -1224,89 +1466,54 @@ class MainScreen:
         iommu_groups: dict[str, list[str]] = {}  # device -> all devices in its group
         disabled_reasons: dict[str, str] = {}  # device -> reason why disabled
         seen_pci_addrs = set()
+        edit_vm_name = self.edit_vm.name
+        get_group = self.gpu_service.get_iommu_group
+        add_option = gpu_options_unsorted.append
+
+        def annotate(label: str, pci: str, driver: str | None) -> tuple[str, bool]:
+            """Suffix a device label with its usage/driver state; returns (label, disabled)."""
+            using_vm = gpu_usage.get(pci)
+            if using_vm is not None and using_vm != edit_vm_name:
+                # Used by another VM
+                disabled_reasons[pci] = f"GPU is in use by {using_vm}"
+                return f"{label} [in use by {using_vm}]", True
+            if driver and driver != "vfio-pci":
+                disabled_reasons[pci] = "GPU must use vfio-pci driver for passthrough"
+                return f"{label} [{driver}]", True
+            if driver == "vfio-pci":
+                return f"{label} [vfio-pci]", False
+            return label, False
 
         for gpu in self.available_gpus:
             pci_addr = gpu.pci_address
             seen_pci_addrs.add(pci_addr)
 
-            group = self.gpu_service.get_iommu_group(pci_addr)
+            group = get_group(pci_addr)
 
             if group and len(group.devices) > 1:
                 # IOMMU group with multiple devices - add all of them
-                device_types = [d.device_type for d in group.devices]
-                type_summary = ", ".join(sorted(set(device_types)))
+                type_summary = ", ".join(sorted({d.device_type for d in group.devices}))
+                group_addrs = group.pci_addresses
 
-                # Store IOMMU group mapping for all devices
-                for group_dev in group.devices:
-                    iommu_groups[group_dev.pci_address] = group.pci_addresses
-
-                # Add all devices in the group to the list
                 for group_dev in group.devices:
                     group_pci_addr = group_dev.pci_address
+                    iommu_groups[group_pci_addr] = group_addrs
                     seen_pci_addrs.add(group_pci_addr)
 
-                    if group_dev.pci_address == pci_addr:
+                    if group_pci_addr == pci_addr:
                         # Primary device (the GPU/VGA controller)
                         group_label = f"{gpu.display_name} (IOMMU: {type_summary})"
                     else:
                         # Companion device (e.g., audio, USB controller)
                         group_label = f"  └─ {group_dev.device_type}: {group_dev.vendor_name} {group_dev.device_name}"
 
-                    disabled = False
-                    disable_reason = None
-
-                    # Check if device is used by another VM
-                    if group_pci_addr in gpu_usage:
-                        using_vm = gpu_usage[group_pci_addr]
-                        if using_vm != self.edit_vm.name:
-                            group_label = f"{group_label} [in use by {using_vm}]"
-                            disabled = True
-                            disable_reason = f"GPU is in use by {using_vm}"
-
-                    # Check driver
-                    if not disabled:
-                        if group_dev.driver and group_dev.driver != "vfio-pci":
-                            group_label = f"{group_label} [{group_dev.driver}]"
-                            disabled = True
-                            disable_reason = "GPU must use vfio-pci driver for passthrough"
-                        else:
-                            if group_dev.driver == "vfio-pci":
-                                group_label = f"{group_label} [vfio-pci]"
-
-                    if disable_reason:
-                        disabled_reasons[group_pci_addr] = disable_reason
-
-                    gpu_options_unsorted.append((group_pci_addr, group_label, disabled, group_pci_addr))
+                    group_label, disabled = annotate(group_label, group_pci_addr, group_dev.driver)
+                    add_option((group_pci_addr, group_label, disabled, group_pci_addr))
             else:
                 # Single device, no group
-                label = gpu.full_description
                 iommu_groups[pci_addr] = [pci_addr]
-
-                disabled = False
-                disable_reason = None
-
-                # Check if device is used by another VM
-                if pci_addr in gpu_usage:
-                    using_vm = gpu_usage[pci_addr]
-                    if using_vm != self.edit_vm.name:
-                        label = f"{label} [in use by {using_vm}]"
-                        disabled = True
-                        disable_reason = f"GPU is in use by {using_vm}"
-
-                # Check driver
-                if not disabled:
-                    if gpu.driver and gpu.driver != "vfio-pci":
-                        label = f"{label} [{gpu.driver}]"
-                        disabled = True
-                        disable_reason = "GPU must use vfio-pci driver for passthrough"
-                    else:
-                        if gpu.driver == "vfio-pci":
-                            label = f"{label} [vfio-pci]"
-
-                if disable_reason:
-                    disabled_reasons[pci_addr] = disable_reason
-
-                gpu_options_unsorted.append((pci_addr, label, disabled, pci_addr))
+                label, disabled = annotate(gpu.full_description, pci_addr, gpu.driver)
+                add_option((pci_addr, label, disabled, pci_addr))
 
         # Sort by PCI address (00.0 before 00.1, etc.)
         gpu_options_unsorted.sort(key=lambda x: x[3])
@@ -1371,7 +1578,7 @@ class MainScreen:
         if self.selected_gpus:
             gpu_names = []
             for addr in self.selected_gpus:
-                gpu = next((g for g in self.available_gpus if g.pci_address == addr), None)
+                gpu = self._gpu_by_addr.get(addr)
                 if gpu:
                     gpu_names.append(gpu.display_name)
                 else:
@@ -1408,8 +1615,9 @@ class MainScreen:
         """Edit USB passthrough selection in inline mode."""
         from vm_manager.ui.widgets.dialog import MessageDialog, ToggleListDialog
 
-        # Get available USB devices
+        # Get available USB devices (fresh, since devices may have been plugged in)
         available_usb = self.usb_service.list_devices()
+        self._store_usb(available_usb)
 
         if not available_usb:
             MessageDialog(
@@ -1489,7 +1697,7 @@ class MainScreen:
         if self.selected_usb:
             usb_names = []
             for usb_id in self.selected_usb:
-                usb = next((u for u in available_usb if u.id_string == usb_id), None)
+                usb = self._usb_by_id.get(usb_id)
                 if usb:
                     usb_names.append(usb.display_name)
                 else:
@@ -1,5 +1,6 @@
 """Dialog widgets for user interaction."""
 
+import time
 from collections.abc import Callable
 
 from blessed import Terminal
@@ -816,40 +817,65 @@ class ProgressDialog(Dialog):
     """Progress dialog with animated throbber."""
 
     THROBBER_FRAMES = ["⠋", "⠙", "⠹", "⠸", "⠼", "⠴", "⠦", "⠧", "⠇", "⠏"]
+    THROBBER_INTERVAL = 0.25  # Seconds between throbber steps
 
     def __init__(self, term: Terminal, theme: Theme, title: str, message: str) -> None:
         super().__init__(term, theme, title)
         self.message = message
         self.frame = 0
+        self._last_tick = 0.0
+        self._last_layout: tuple[str, str, int, int] | None = None
+        self._last_rendered: tuple[str, str, int, int, int] | None = None
+        self._last_box: tuple[int, int, int, int] | None = None  # (x, y, width, height) on screen
 
     def show_frame(self) -> None:
-        """Show one frame of the progress dialog."""
+        """Show one frame of the progress dialog (no output if nothing changed)."""
+        # Advance the throbber on its own slower tick
+        now = time.monotonic()
+        if now - self._last_tick >= self.THROBBER_INTERVAL:
+            if self._last_rendered is not None:
+                self.frame += 1
+            self._last_tick = now
+
+        term_width, term_height = self.term.width, self.term.height
+        state = (self.title, self.message, self.frame, term_width, term_height)
+        if state == self._last_rendered:
+            return
+
         # Calculate width based on message length
         width = max(60, len(self.message) + 10)
         height = 9
         x, y = self.center_position(width, height)
 
-        # Draw box
-        lines = self._draw_box(x, y, width, height)
-        for line in lines:
-            print(line, end="", flush=True)
-
-        # Draw message
-        msg_y = y + 4
-        print(
-            self.term.move_xy(x + (width - len(self.message)) // 2, msg_y) + self.message,
-            end="",
-            flush=True,
-        )
+        output: list[str] = []
+
+        # Box and message only change with title/message or the terminal size
+        layout = (self.title, self.message, term_width, term_height)
+        if layout != self._last_layout:
+            box = (x, y, width, height)
+            if self._last_box is not None and self._last_box != box:
+                # Blank the previous box (clipped to the current screen) so it
+                # doesn't linger next to the re-centered one
+                old_x, old_y, old_width, old_height = self._last_box
+                left = max(old_x, 0)
+                blank = " " * max(min(old_x + old_width, term_width) - left, 0)
+                if blank:
+                    for row in range(max(old_y, 0), min(old_y + old_height, term_height)):
+                        output.append(self.term.move_xy(left, row) + blank)
+            output.extend(self._draw_box(x, y, width, height))
+            output.append(
+                self.term.move_xy(x + (width - len(self.message)) // 2, y + 4) + self.message
+            )
+            self._last_layout = layout
+            self._last_box = box
 
         # Draw throbber
         throbber = self.THROBBER_FRAMES[self.frame % len(self.THROBBER_FRAMES)]
         throbber_y = y + 6
-        print(
+        output.append(
             self.term.move_xy(x + width // 2 - 1, throbber_y)
-            + self.theme.info(throbber + " "),
-            end="",
-            flush=True,
+            + self.theme.info(throbber + " ")
         )
 
-        self.frame += 1
+        print("".join(output), end="", flush=True)
+        self._last_rendered = state
@@ -72,6 +72,7 @@ class Form:
         self.term = term
         self.theme = theme
         self.fields = fields
+        self.fields_by_name: dict[str, FormField] = {f.name: f for f in fields}
         self.buttons = buttons or [("cancel", "Cancel"), ("next", "Next")]
 
         self.focused_index = 0
@@ -79,6 +80,11 @@ class Form:
         self.focused_button = 0
         self.error_message = ""
 
+        # What each part of the form looked like when last drawn (see render_dirty)
+        self._drawn_fields: dict[int, tuple[object, ...]] = {}
+        self._drawn_buttons: tuple[bool, int] | None = None
+        self._drawn_error: str | None = None
+
     @property
     def focused_field(self) -> FormField | None:
         """Get currently focused field."""
@@ -92,11 +98,15 @@ class Form:
 
     def set_value(self, name: str, value: str) -> None:
         """Set a field value by name."""
-        for f in self.fields:
-            if f.name == name:
-                f.value = value
-                f.cursor_pos = len(value)
-                break
+        f = self.fields_by_name.get(name)
+        if f:
+            f.value = value
+            f.cursor_pos = len(value)
+
+    def _field_state(self, index: int, field: FormField) -> tuple[object, ...]:
+        """Everything that affects how a field is drawn."""
+        is_focused = (not self.in_button_row) and (index == self.focused_index)
+        return (field.label, field.get_display_value(), field.cursor_pos, field.disabled, is_focused)
 
     def render(self, x: int, y: int, width: int) -> int:
         """Render the form. Returns number of lines used."""
@@ -107,11 +117,14 @@ class Form:
             is_focused = (not self.in_button_row) and (i == self.focused_index)
             lines_used += self._render_field(x, y + lines_used, width, field, is_focused)
             lines_used += 1  # spacing
+            self._drawn_fields[i] = self._field_state(i, field)
 
         # Render buttons
         lines_used += 1  # extra spacing before buttons
         self._render_buttons(x, y + lines_used, width)
+        self._drawn_buttons = (self.in_button_row, self.focused_button)
         lines_used += 1
+        self._drawn_error = self.error_message
 
         # Render error message
         if self.error_message:
@@ -124,6 +137,39 @@ class Form:
 
         return lines_used
 
+    def render_dirty(self, x: int, y: int, width: int) -> None:
+        """Redraw only the parts of the form that changed since the last render.
+
+        Assumes the form was previously drawn with render() at the same position.
+        """
+        row = y
+        for i, field in enumerate(self.fields):
+            is_focused = (not self.in_button_row) and (i == self.focused_index)
+            state = self._field_state(i, field)
+            if self._drawn_fields.get(i) != state:
+                print(
+                    self.term.move_xy(x, row) + self.term.clear_eol
+                    + self.term.move_xy(x, row + 1) + self.term.clear_eol,
+                    end="",
+                )
+                self._render_field(x, row, width, field, is_focused)
+                self._drawn_fields[i] = state
+            row += 3  # 2 lines per field + spacing
+
+        row += 1  # extra spacing before buttons
+        buttons = (self.in_button_row, self.focused_button)
+        if buttons != self._drawn_buttons:
+            print(self.term.move_xy(x, row) + self.term.clear_eol, end="")
+            self._render_buttons(x, row, width)
+            self._drawn_buttons = buttons
+
+        if self.error_message != self._drawn_error:
+            error_line = self.term.move_xy(x, row + 2) + self.term.clear_eol
+            if self.error_message:
+                error_line += self.theme.error(self.error_message[:width])
+            print(error_line, end="")
+            self._drawn_error = self.error_message
+
     def _render_field(
         self, x: int, y: int, width: int, field: FormField, is_focused: bool
     ) -> int:
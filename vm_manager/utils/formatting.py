@@ -1,6 +1,9 @@
 """Formatting utilities."""
 
+from functools import lru_cache
 
+
+@lru_cache(maxsize=1024)
 def format_bytes(num_bytes: int) -> str:
     """Format bytes as human-readable string."""
     for unit in ["B", "KB", "MB", "GB", "TB"]:
@@ -20,6 +23,13 @@ def format_duration(seconds: int) -> str:
         secs = seconds % 60
         return f"{minutes}m {secs}s"
 
+    # Past an hour seconds aren't shown, so cache on whole minutes
+    return _format_minutes(minutes)
+
+
+@lru_cache(maxsize=1024)
+def _format_minutes(minutes: int) -> str:
+    """Format a duration of an hour or more, given in whole minutes."""
     hours = minutes // 60
     mins = minutes % 60
     if hours < 24: